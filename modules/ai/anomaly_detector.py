@@ -8,7 +8,7 @@ import pandas as pd
 
 from modules.logger import logger
 from modules.transaction_types import filter_expense_transactions
-from modules.utils import clean_label
+from modules.utils import clean_label_series
 
 
 def detect_amount_anomalies(df: pd.DataFrame, threshold_sigma: float = 2.0) -> list:
@@ -48,7 +48,7 @@ def detect_amount_anomalies(df: pd.DataFrame, threshold_sigma: float = 2.0) -> l
 
     # Use absolute values for analysis
     df_exp["abs_amount"] = df_exp["amount"].abs()
-    df_exp["clean"] = df_exp["label"].apply(clean_label)
+    df_exp["clean"] = clean_label_series(df_exp["label"])
 
     # Group by clean label and calculate statistics
     stats = df_exp.groupby("clean")["abs_amount"].agg(["mean", "std", "count"]).reset_index()
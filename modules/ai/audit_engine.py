@@ -9,8 +9,8 @@ from typing import Any
 import pandas as pd
 
 from modules.ai_manager import get_active_model_name, get_ai_provider
-from modules.categorization import clean_label
 from modules.logger import logger
+from modules.utils import clean_label_series
 
 
 def detect_inconsistencies(df: pd.DataFrame) -> list[dict[str, Any]]:
@@ -28,7 +28,7 @@ def detect_inconsistencies(df: pd.DataFrame) -> list[dict[str, Any]]:
 
     # Create a clean label column for grouping
     df = df.copy()
-    df["clean"] = df["label"].apply(clean_label)
+    df["clean"] = clean_label_series(df["label"])
 
     # Filter only validated or relevant categories
     df_valid = df[
@@ -81,7 +81,7 @@ def ai_audit_batch(df: pd.DataFrame, limit: int = 50) -> list[dict[str, Any]]:
 
     # Get unique pairs of (clean_label, category)
     df = df.copy()
-    df["clean"] = df["label"].apply(clean_label)
+    df["clean"] = clean_label_series(df["label"])
     unique_pairs = df[["clean", "category_validated"]].drop_duplicates()
 
     # Limit for performance
@@ -21,10 +21,18 @@ def _on_transactions_changed(**kwargs):
     """Handle transaction changes by clearing related caches."""
     try:
         # Import inside handler to avoid circular dependency at module level
-        from modules.db.transactions import get_all_hashes, get_all_transactions
+        from modules.db.stats import get_all_account_labels, get_recent_imports
+        from modules.db.transactions import (
+            get_all_hashes,
+            get_all_transactions,
+            get_pending_transactions,
+        )
 
         get_all_transactions.clear()
         get_all_hashes.clear()
+        get_pending_transactions.clear()
+        get_all_account_labels.clear()
+        get_recent_imports.clear()
         logger.debug("Transaction caches cleared via event")
     except Exception as e:
         logger.warning("Failed to clear transaction caches: " + str(e))
@@ -34,15 +42,20 @@ def _on_transactions_changed(**kwargs):
 def _on_transactions_batch_changed(**kwargs):
     """Handle batch transaction changes."""
     try:
+        from modules.db.stats import get_all_account_labels, get_recent_imports
         from modules.db.transactions import (
             get_all_hashes,
             get_all_transactions,
+            get_pending_transactions,
             get_transactions_count,
         )
 
         get_all_transactions.clear()
         get_all_hashes.clear()
         get_transactions_count.clear()
+        get_pending_transactions.clear()
+        get_all_account_labels.clear()
+        get_recent_imports.clear()
         logger.debug("Transaction batch caches cleared via event")
     except Exception as e:
         logger.warning("Failed to clear batch transaction caches: " + str(e))
@@ -65,10 +78,15 @@ def _on_rules_changed(**kwargs):
 def _on_categories_changed(**kwargs):
     """Handle category changes by clearing category caches."""
     try:
-        from modules.db.categories import get_categories, get_categories_with_emojis
+        from modules.db.categories import (
+            get_categories,
+            get_categories_suggested_tags,
+            get_categories_with_emojis,
+        )
 
         get_categories.clear()
         get_categories_with_emojis.clear()
+        get_categories_suggested_tags.clear()
         logger.debug("Category caches cleared via event")
     except Exception as e:
         logger.warning("Failed to clear category caches: " + str(e))
@@ -78,9 +96,10 @@ def _on_categories_changed(**kwargs):
 def _on_members_changed(**kwargs):
     """Handle member changes by clearing member caches."""
     try:
-        from modules.db.members import get_members
+        from modules.db.members import get_member_mappings, get_members
 
         get_members.clear()
+        get_member_mappings.clear()
         logger.debug("Member caches cleared via event")
     except Exception as e:
         logger.warning("Failed to clear member caches: " + str(e))
@@ -94,8 +113,10 @@ def _on_tags_changed(**kwargs):
     invalidate transaction caches to reflect tag changes.
     """
     try:
+        from modules.db.tags import get_all_tags
         from modules.db.transactions import get_all_transactions
 
+        get_all_tags.clear()
         get_all_transactions.clear()
         logger.debug("Tag caches cleared via event")
     except Exception as e:
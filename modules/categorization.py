@@ -11,8 +11,10 @@ Implémente la cascade de catégorisation :
 """
 
 import re
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from modules.ai_cache import get_cached_categorization, cache_categorization_result
@@ -106,13 +108,120 @@ def categorize_transactions_batch(
     rules_df = get_learning_rules()
     rules = rules_df.to_dict('records') if not rules_df.empty else []
     
-    results = []
-    for _, row in df.iterrows():
-        tx = {"label": row.get("label", ""), "amount": row.get("amount", 0.0)}
-        category = categorize_transaction(tx, rules=rules, use_ai=use_ai)
-        results.append(category)
-    
-    return results
+    # Colonnes zippées directement : pas de Series construite par ligne (iterrows)
+    labels = df["label"] if "label" in df.columns else [""] * len(df)
+    amounts = df["amount"] if "amount" in df.columns else [0.0] * len(df)
+
+    return [
+        categorize_transaction({"label": label, "amount": amount}, rules=rules, use_ai=use_ai)
+        for label, amount in zip(labels, amounts)
+    ]
+
+
+@lru_cache(maxsize=32)
+def _compile_rule_scanner(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile les motifs des règles en une seule alternative (scan unique par libellé)."""
+    return re.compile("|".join(re.escape(p) for p in patterns))
+
+
+def categorize_columns(
+    labels,
+    amounts,
+    dates=None,
+    rules: list[dict] | None = None,
+    use_ai: bool = False,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Catégorise des colonnes de transactions de manière vectorisée.
+
+    Même cascade que categorize_transaction (règle exacte, puis règle partielle
+    par priorité décroissante, puis IA), mais chaque règle est appliquée en une
+    seule passe sur toute la colonne au lieu d'un appel Python par ligne.
+
+    Args:
+        labels: Libellés (array-like)
+        amounts: Montants (array-like)
+        dates: Dates (array-like, optionnel, réservé pour l'IA)
+        rules: Liste optionnelle de règles (sinon récupère depuis DB)
+        use_ai: Utiliser l'IA sur les libellés non reconnus par les règles
+
+    Returns:
+        Tuple (categories, sources, confidences) de ndarrays alignés sur l'entrée.
+        sources vaut "rule", "ai" ou "none".
+    """
+    n = len(labels)
+    categories = np.full(n, SystemCategory.UNKNOWN, dtype=object)
+    sources = np.full(n, "none", dtype=object)
+    confidences = np.zeros(n, dtype=float)
+    if n == 0:
+        return categories, sources, confidences
+
+    if rules is None:
+        rules_df = get_learning_rules()
+        rules = rules_df.to_dict("records") if not rules_df.empty else []
+
+    labels = np.asarray(labels, dtype=object)
+    labels_upper = pd.Series(labels).fillna("").astype(str).str.upper()
+
+    # Les règles sont évaluées une seule fois par libellé distinct
+    codes, unique_labels = pd.factorize(labels_upper)
+    unique_upper = pd.Series(unique_labels, dtype=object)
+    u_categories = np.full(len(unique_upper), SystemCategory.UNKNOWN, dtype=object)
+    u_confidences = np.zeros(len(unique_upper), dtype=float)
+
+    # 1. Règles exactes : la première règle de la liste l'emporte
+    exact_map: dict[str, str] = {}
+    for rule in rules:
+        exact_map.setdefault(
+            rule.get("pattern", "").upper(), rule.get("category", SystemCategory.UNKNOWN)
+        )
+    exact = unique_upper.map(exact_map)
+    u_matched = exact.notna().to_numpy()
+    u_categories[u_matched] = exact[u_matched].to_numpy()
+    u_confidences[u_matched] = 1.0
+
+    # 2. Règles partielles, par priorité décroissante, sur les libellés restants.
+    # Un seul scan combiné élimine d'abord les libellés qui ne contiennent aucun motif.
+    partial_rules = sorted(rules, key=lambda r: r.get("priority", 0), reverse=True)
+    patterns = tuple(rule.get("pattern", "").upper() for rule in partial_rules)
+    if patterns and not u_matched.all():
+        scanner = _compile_rule_scanner(patterns)
+        candidates = ~u_matched & unique_upper.str.contains(scanner).to_numpy()
+        for rule, pattern in zip(partial_rules, patterns):
+            remaining = np.flatnonzero(candidates)
+            if remaining.size == 0:
+                break
+            hits = remaining[
+                unique_upper.iloc[remaining].str.contains(pattern, regex=False).to_numpy()
+            ]
+            if hits.size:
+                u_categories[hits] = rule.get("category", SystemCategory.UNKNOWN)
+                u_confidences[hits] = 0.9
+                u_matched[hits] = True
+                candidates[hits] = False
+
+    # Report des résultats par libellé distinct sur toutes les lignes
+    matched = u_matched[codes]
+    categories[:] = u_categories[codes]
+    sources[matched] = "rule"
+    confidences[:] = u_confidences[codes]
+
+    # 3. IA sur les couples (libellé, montant) uniques non reconnus
+    if use_ai and not matched.all():
+        amounts_arr = np.asarray(amounts)
+        ai_results: dict[tuple[str, float], str] = {}
+        for i in np.flatnonzero(~matched):
+            key = (str(labels[i]), float(amounts_arr[i]))
+            if key not in ai_results:
+                ai_results[key] = categorize_transaction(
+                    {"label": key[0], "amount": key[1]}, rules=[], use_ai=True
+                )
+            if ai_results[key] != SystemCategory.UNKNOWN:
+                categories[i] = ai_results[key]
+                sources[i] = "ai"
+                confidences[i] = 0.8
+
+    return categories, sources, confidences
 
 
 def get_cached_category(label: str, amount: float) -> str | None:
@@ -109,7 +109,7 @@ def auto_fix_common_inconsistencies() -> int:
             tags = set([t.strip().lower() for t in (current_tags or "").split(",") if t.strip()])
             if "rapproché" not in tags:
                 tags.add("rapproché")
-                new_tags = ", ".join(sorted(list(tags)))
+                new_tags = ", ".join(sorted(tags))
                 match_updates.append((new_tags, id1))
                 match_updates.append((new_tags, id2))
 
@@ -185,7 +185,7 @@ def auto_fix_common_inconsistencies() -> int:
             if "AVOIR" in label_upper or (cat in expense_cats and amount > 0):
                 current_tags.add("remboursement")
             if len(current_tags) > orig_len:
-                tag_updates.append((", ".join(sorted(list(current_tags))), tx_id))
+                tag_updates.append((", ".join(sorted(current_tags)), tx_id))
 
         if tag_updates:
             cursor.executemany("UPDATE transactions SET tags = ? WHERE id = ?", tag_updates)
@@ -324,7 +324,7 @@ def get_transfer_inconsistencies() -> tuple[pd.DataFrame, pd.DataFrame]:
         # 1. Build detection pattern from keywords and targets
         keywords = get_internal_transfer_keywords()
         targets = get_internal_transfer_targets()
-        all_patterns = sorted(list(set(keywords + targets)))
+        all_patterns = sorted({*keywords, *targets})
 
         # Build parameterized LIKE clauses
         likes_placeholders = " OR ".join(["upper(label) LIKE ?" for _ in all_patterns])
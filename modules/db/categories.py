@@ -197,7 +197,7 @@ def get_all_categories_including_ghosts() -> list[dict]:
         used_set = set(used_df["category_validated"].tolist())
 
         # Union of both
-        all_names = sorted(list(official_set.union(used_set)))
+        all_names = sorted(official_set.union(used_set))
 
         all_cats = []
         for name in all_names:
@@ -156,7 +156,7 @@ def get_orphan_labels() -> list[str]:
         all_txn_values = txn_members.union(txn_benefs)
         orphans = all_txn_values - official_members
 
-        return sorted(list(orphans))
+        return sorted(orphans)
 
 
 def delete_and_replace_label(old_label: str, replacement_label: str = "Inconnu") -> int:
@@ -291,7 +291,7 @@ def get_unique_members() -> list[str]:
 
         # If user has configured members, strictly follow that list (Managed Mode)
         if cfg_members:
-            return sorted(list(set(cfg_members)))
+            return sorted(set(cfg_members))
 
         # 2. Fallback: Auto-discovery from transactions (Legacy/Unmanaged Mode)
         df_tx_m = pd.read_sql(
@@ -317,7 +317,7 @@ def get_unique_members() -> list[str]:
             if norm not in seen:
                 seen[norm] = name
 
-        return sorted(list(seen.values()))
+        return sorted(seen.values())
 
 
 def update_transaction_member(tx_id: int, new_member: str) -> None:
@@ -328,6 +328,20 @@ def update_transaction_member(tx_id: int, new_member: str) -> None:
         conn.commit()
 
 
+def bulk_update_transaction_members(tx_ids: list[int], new_member: str) -> None:
+    """Update the member of several transactions in a single statement."""
+    if not tx_ids:
+        return
+    placeholders = ", ".join(["?"] * len(tx_ids))
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            f"UPDATE transactions SET member = ? WHERE id IN ({placeholders})",
+            [new_member, *tx_ids],
+        )
+        conn.commit()
+
+
 def get_all_member_names() -> list[str]:
     """Get all unique member names from the database."""
     with get_db_connection() as conn:
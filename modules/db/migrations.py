@@ -100,6 +100,9 @@ def init_db() -> None:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_member ON transactions(member)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_label ON transactions(label)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_amount ON transactions(amount)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_account_label ON transactions(account_label)"
+        )
 
         # Composite Indexes for common query patterns
         cursor.execute(
@@ -110,6 +113,10 @@ def init_db() -> None:
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_category_amount ON transactions(category_validated, amount)"
         )
+        # Duplicate detection in save_transactions: WHERE (date, label, amount) IN (...)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_date_label_amount ON transactions(date, label, amount)"
+        )
 
         # Categories table
         cursor.execute("""
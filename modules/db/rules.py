@@ -61,6 +61,44 @@ def add_learning_rule(pattern: str, category: str, priority: int = 1) -> bool:
             return False
 
 
+def add_learning_rules(rules: list[tuple[str, str]], priority: int = 1) -> int:
+    """
+    Add or update several learning rules in a single transaction.
+
+    Args:
+        rules: (pattern, category) pairs
+        priority: Rule priority applied to every rule. Default: 1
+
+    Returns:
+        Number of rules written (invalid patterns are skipped)
+    """
+    valid_rules = []
+    for pattern, category in rules:
+        # Valider le pattern avant insertion (protection ReDoS)
+        is_valid, error_msg = validate_regex_pattern(pattern)
+        if is_valid:
+            valid_rules.append((pattern, category, priority))
+        else:
+            logger.error(f"Invalid rule pattern: {error_msg}")
+
+    if not valid_rules:
+        return 0
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(
+                "INSERT OR REPLACE INTO learning_rules (pattern, category, priority) VALUES (?, ?, ?)",
+                valid_rules,
+            )
+            conn.commit()
+            logger.info(f"{len(valid_rules)} learning rules added (priority={priority})")
+            return len(valid_rules)
+        except Exception as e:
+            logger.error(f"Error adding rules: {e}")
+            return 0
+
+
 @st.cache_data(ttl="1h")
 def get_learning_rules() -> pd.DataFrame:
     """
@@ -115,6 +115,7 @@ def get_available_months() -> list[str]:
         return df["month"].tolist()
 
 
+@st.cache_data(ttl=60)
 def get_all_account_labels() -> list[str]:
     """
     Retrieve all unique account labels used in transactions.
@@ -133,6 +134,7 @@ def get_all_account_labels() -> list[str]:
         return df["account_label"].tolist()
 
 
+@st.cache_data(ttl=60)
 def get_recent_imports(limit: int = 3) -> pd.DataFrame:
     """
     Get summary of the latest import sessions.
@@ -35,7 +35,7 @@ def get_all_tags() -> list[str]:
                 tags = [t.strip() for t in tags_str.split(",")]
                 all_tags.update(tags)
 
-        return sorted(list(all_tags))
+        return sorted(all_tags)
 
 
 def remove_tag_from_all_transactions(tag_to_remove: str) -> int:
@@ -149,7 +149,7 @@ def learn_tags_from_history() -> int:
                 # Merge with learned tags
                 new_set = existing.union(tags)
                 if len(new_set) > len(existing):
-                    new_str = ", ".join(sorted(list(new_set)))
+                    new_str = ", ".join(sorted(new_set))
                     updates.append((new_str, cat_id))
                     count_learned += len(new_set) - len(existing)
 
@@ -181,4 +181,4 @@ def normalize_tags_for_transaction(tags_str: str) -> str:
         return ""
 
     tags = [t.strip().lower() for t in tags_str.split(",") if t.strip()]
-    return ", ".join(sorted(list(set(tags))))
+    return ", ".join(sorted(set(tags)))
@@ -10,9 +10,13 @@ import streamlit as st
 
 from modules.core.events import EventBus
 from modules.db.connection import build_filter_clause, clear_db_cache, get_db_connection
-from modules.db.members import detect_member_from_content, get_member_mappings
+from modules.db.members import detect_member_from_content, get_member_detection_data
 from modules.logger import logger
 
+# (date, label, amount) signatures per COUNT query: 3 bound variables each,
+# kept under SQLite's historical 999-variable limit
+SIGNATURE_CHUNK_SIZE = 300
+
 
 def transaction_exists(cursor, tx_hash: str) -> bool:
     """
@@ -71,11 +75,12 @@ def save_transactions(df: pd.DataFrame) -> tuple[int, int]:
         new_count = 0
         skipped_count = 0
 
-        # Pre-load member mappings
-        get_member_mappings()
+        # Pre-load member detection data once for the whole batch
+        detection_data = get_member_detection_data()
 
-        # Ensure date is string for consistent grouping/querying
-        df["date_str"] = df["date"].astype(str)
+        # Date as string for consistent grouping/querying, used as a group key
+        # only (not stored as a temporary column on the caller's DataFrame)
+        date_key = df["date"].astype(str)
 
         # Ensure account_label exists for grouping
         if "account_label" not in df.columns:
@@ -83,16 +88,18 @@ def save_transactions(df: pd.DataFrame) -> tuple[int, int]:
 
         # Group by signature (date, label, amount) - Account REMOVED from signature for global deduplication
         # This prevents importing the same transaction twice if the account name changes.
-        grouped = df.groupby(["date_str", "label", "amount"])
+        grouped = df.groupby([date_key, "label", "amount"])
 
         # OPTIMIZATION #1: Batch COUNT query instead of N+1 queries
-        # Extract all unique (date, label, amount) tuples
-        unique_sigs = [(date, label, amount) for (date, label, amount), _ in grouped]
-
-        # Build batch query for all signatures
-        if len(unique_sigs) > 0:
-            # Create placeholders for IN clause
-            placeholders = ",".join(["(?,?,?)"] * len(unique_sigs))
+        # Extract all unique (date, label, amount) tuples with their row positions
+        group_positions = grouped.indices
+        unique_sigs = list(group_positions.keys())
+
+        # Batch COUNT queries, chunked to stay under SQLite's bound-variable limit
+        db_counts = {}
+        for start in range(0, len(unique_sigs), SIGNATURE_CHUNK_SIZE):
+            chunk = unique_sigs[start : start + SIGNATURE_CHUNK_SIZE]
+            placeholders = ",".join(["(?,?,?)"] * len(chunk))
             batch_query = f"""
                 SELECT date, label, amount, COUNT(*) as cnt
                 FROM transactions
@@ -100,24 +107,20 @@ def save_transactions(df: pd.DataFrame) -> tuple[int, int]:
                 GROUP BY date, label, amount
             """
             # Flatten tuples for query params
-            flat_params = [item for sig in unique_sigs for item in sig]
+            flat_params = [item for sig in chunk for item in sig]
             cursor.execute(batch_query, flat_params)
 
             # Build lookup dict: (date, label, amount) -> count
-            db_counts = {(row[0], row[1], row[2]): row[3] for row in cursor.fetchall()}
-        else:
-            db_counts = {}
-
-        # OPTIMIZATION #2: Collect all rows to insert, then use executemany()
-        rows_to_insert = []
-        insert_columns = None
+            db_counts.update({(row[0], row[1], row[2]): row[3] for row in cursor.fetchall()})
 
-        for (date, label, amount), group in grouped:
+        # OPTIMIZATION #2: Select the surplus rows by position, then one executemany()
+        insert_positions = []
+        for sig, positions in group_positions.items():
             # Get DB count from batch query result
-            db_count = db_counts.get((date, label, amount), 0)
+            db_count = db_counts.get(sig, 0)
 
             # Count in Input
-            input_count = len(group)
+            input_count = len(positions)
 
             # Calculate Delta
             to_insert_count = max(0, input_count - db_count)
@@ -125,36 +128,46 @@ def save_transactions(df: pd.DataFrame) -> tuple[int, int]:
 
             if to_insert_count > 0:
                 # Take the last N rows from the group
-                group_to_insert = group.tail(to_insert_count)
-
-                for _, row in group_to_insert.iterrows():
-                    row_dict = row.to_dict()
-
-                    # Cleanup temp columns
-                    if "date_str" in row_dict:
-                        del row_dict["date_str"]
-
-                    # Apply member mapping (Smart Detection) - ONLY if not provided or Inconnu
-                    if row_dict.get("member") in [None, "", "Inconnu"]:
-                        suffix = row_dict.get("card_suffix")
-                        account = row_dict.get("account_label")
-                        row_dict["member"] = detect_member_from_content(
-                            label=row_dict["label"], card_suffix=suffix, account_label=account
-                        )
-
-                    # Store column order on first row
-                    if insert_columns is None:
-                        insert_columns = list(row_dict.keys())
-
-                    rows_to_insert.append(tuple(row_dict.values()))
-
-        # Batch insert with executemany()
-        if rows_to_insert and insert_columns:
-            cols = ", ".join(insert_columns)
-            placeholders = ", ".join(["?"] * len(insert_columns))
+                insert_positions.extend(positions[-to_insert_count:])
+
+        if insert_positions:
+            to_insert = df.iloc[insert_positions]
+
+            # Apply member mapping (Smart Detection) - ONLY if not provided or Inconnu.
+            # Detection result depends only on (label, card_suffix, account_label)
+            if "member" in to_insert.columns:
+                member = to_insert["member"].astype(object)
+            else:
+                member = pd.Series(None, index=to_insert.index, dtype=object)
+            needs_detection = (member.isna() | member.isin(["", "Inconnu"])).to_numpy()
+            if needs_detection.any():
+                pending = to_insert[needs_detection]
+                suffixes = (
+                    pending["card_suffix"]
+                    if "card_suffix" in pending.columns
+                    else [None] * len(pending)
+                )
+                keys = list(zip(pending["label"], suffixes, pending["account_label"]))
+                detected_members = {
+                    key: detect_member_from_content(
+                        label=key[0],
+                        card_suffix=key[1],
+                        account_label=key[2],
+                        cached_data=detection_data,
+                    )
+                    for key in dict.fromkeys(keys)
+                }
+                member = member.copy()
+                member[needs_detection] = [detected_members[key] for key in keys]
+            to_insert = to_insert.assign(member=member)
+
+            # Batch insert with executemany() in a single transaction
+            # over positional tuples (native Python scalars)
+            cols = ", ".join(to_insert.columns)
+            placeholders = ", ".join(["?"] * len(to_insert.columns))
             query = f"INSERT INTO transactions ({cols}) VALUES ({placeholders})"
-            cursor.executemany(query, rows_to_insert)
-            new_count = len(rows_to_insert)
+            cursor.executemany(query, to_insert.itertuples(index=False, name=None))
+            new_count = len(to_insert)
 
         conn.commit()
 
@@ -409,8 +422,40 @@ def get_all_hashes() -> set[str]:
         Set of all tx_hash values
     """
     with get_db_connection() as conn:
-        df = pd.read_sql("SELECT tx_hash FROM transactions WHERE tx_hash IS NOT NULL", conn)
-        return set(df["tx_hash"].tolist())
+        cursor = conn.execute("SELECT tx_hash FROM transactions WHERE tx_hash IS NOT NULL")
+        return {row[0] for row in cursor.fetchall()}
+
+
+def get_existing_hashes(hashes: list[str]) -> set[str]:
+    """
+    Return the subset of the given tx_hash values already present in the database.
+
+    The candidate hashes are loaded into a temporary table and semi-joined
+    against transactions in one query (served by the unique tx_hash index),
+    so the cost depends on the size of the import, not on the size of the table.
+
+    Args:
+        hashes: Candidate transaction hashes
+
+    Returns:
+        Set of hashes that already exist
+    """
+    candidates = {h for h in hashes if h}
+    if not candidates:
+        return set()
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        # TEMP table lives only as long as this connection
+        cursor.execute("CREATE TEMP TABLE candidate_hashes (tx_hash TEXT PRIMARY KEY)")
+        cursor.executemany(
+            "INSERT INTO candidate_hashes (tx_hash) VALUES (?)", ((h,) for h in candidates)
+        )
+        cursor.execute(
+            "SELECT tx_hash FROM candidate_hashes "
+            "WHERE tx_hash IN (SELECT tx_hash FROM transactions)"
+        )
+        return {row[0] for row in cursor}
 
 
 @st.cache_data(show_spinner="Chargement des données...")
@@ -566,6 +611,71 @@ def bulk_update_transaction_status(
     EventBus.emit("transactions.changed", tx_ids=tx_ids, action="bulk_updated")
 
 
+def bulk_validate_transactions(
+    tx_ids: list[int],
+    categories: list[str],
+    members: list[str | None] | None = None,
+) -> None:
+    """
+    Validate transactions with a per-transaction category (and member) in one go.
+
+    All updates run in a single executemany() inside one transaction and share
+    one action group, so a single undo_last_action() reverts the whole batch.
+
+    Args:
+        tx_ids: List of transaction IDs to validate
+        categories: Category for each transaction (aligned with tx_ids)
+        members: Optional member for each transaction; None keeps the current member
+    """
+    if not tx_ids:
+        return
+
+    if members is None:
+        members = [None] * len(tx_ids)
+
+    action_id = str(uuid.uuid4())[:8]
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+
+        # 1. Capture Previous State for Undo
+        placeholders = ", ".join(["?"] * len(tx_ids))
+        cursor.execute(
+            f"SELECT id, status, category_validated, member, tags, beneficiary, notes "
+            f"FROM transactions WHERE id IN ({placeholders})",
+            list(tx_ids),
+        )
+        history_records = [
+            (action_id, str(r[0]), r[1], r[2], r[3], r[4], r[5], r[6]) for r in cursor.fetchall()
+        ]
+        if history_records:
+            cursor.executemany(
+                """
+                INSERT INTO transaction_history 
+                (action_group_id, tx_ids, prev_status, prev_category, prev_member, 
+                 prev_tags, prev_beneficiary, prev_notes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                history_records,
+            )
+
+        # 2. Apply all updates in one round trip
+        cursor.executemany(
+            """
+            UPDATE transactions 
+            SET category_validated = ?, status = 'validated', member = COALESCE(?, member)
+            WHERE id = ?
+            """,
+            zip(categories, members, tx_ids),
+        )
+        conn.commit()
+
+    get_all_transactions.clear()
+    get_pending_transactions.clear()
+
+    EventBus.emit("transactions.changed", tx_ids=tx_ids, action="bulk_validated")
+
+
 def undo_last_action() -> tuple[bool, str]:
     """
     Revert the last validation action group.
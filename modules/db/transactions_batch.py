@@ -5,6 +5,7 @@ Provides atomic operations for complex database updates.
 
 from contextlib import contextmanager
 
+import numpy as np
 import pandas as pd
 
 from modules.db.connection import get_db_connection
@@ -134,37 +135,53 @@ def batch_categorize_transactions(
     Example:
         df = batch_categorize_transactions(df, use_ai=True)
     """
-    from modules.categorization import categorize_transaction
-    from modules.db.rules import get_compiled_learning_rules
+    from modules.categorization import categorize_columns
+    from modules.db.rules import get_learning_rules
 
-    # Pre-load rules for performance
-    get_compiled_learning_rules()
+    # Pre-load rules once for every chunk
+    rules_df = get_learning_rules()
+    rules = rules_df.to_dict("records") if not rules_df.empty else []
 
-    results = []
     total = len(transactions_df)
-
-    for i, (idx, row) in enumerate(transactions_df.iterrows()):
-        # Update progress
-        if progress_callback and i % 10 == 0:
-            progress_callback(i, total)
-
-        # Categorize
-        cat, source, conf = categorize_transaction(row["label"], row["amount"], row["date"])
-
-        results.append(
-            {
-                "category_validated": cat if cat else "Inconnu",
-                "ai_confidence": conf,
-                "status": "validated" if source == "rule" else "pending",
-            }
+    labels = transactions_df["label"].to_numpy()
+    amounts = transactions_df["amount"].to_numpy()
+    dates = transactions_df["date"].to_numpy()
+
+    # Vectorized categorization, chunked only to report progress
+    # (at least 1000 rows per chunk, at most ~100 progress updates)
+    chunk_size = max(1000, -(-total // 100))
+    blocks = []
+    for start in range(0, total, chunk_size):
+        if progress_callback:
+            progress_callback(start, total)
+        chunk = slice(start, start + chunk_size)
+        blocks.append(
+            categorize_columns(
+                labels[chunk], amounts[chunk], dates[chunk], rules=rules, use_ai=use_ai
+            )
         )
 
     # Update progress at end
     if progress_callback:
         progress_callback(total, total)
 
+    if blocks:
+        categories = np.concatenate([b[0] for b in blocks])
+        sources = np.concatenate([b[1] for b in blocks])
+        confidences = np.concatenate([b[2] for b in blocks])
+    else:
+        categories = sources = np.array([], dtype=object)
+        confidences = np.array([], dtype=float)
+
     # Merge results
-    results_df = pd.DataFrame(results, index=transactions_df.index)
+    results_df = pd.DataFrame(
+        {
+            "category_validated": np.where(categories != "", categories, "Inconnu"),
+            "ai_confidence": confidences,
+            "status": np.where(sources == "rule", "validated", "pending"),
+        },
+        index=transactions_df.index,
+    )
     return pd.concat([transactions_df, results_df], axis=1)
 
 
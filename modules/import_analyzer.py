@@ -7,7 +7,7 @@ from datetime import datetime
 import pandas as pd
 import streamlit as st
 
-from modules.notifications_realtime import RealTimeAlert, get_notification_manager
+from modules.notifications.realtime import RealTimeAlert, get_notification_manager
 from modules.transaction_types import filter_expense_transactions, filter_income_transactions
 
 
@@ -30,8 +30,7 @@ def analyze_imported_transactions(df_new: pd.DataFrame, df_history: pd.DataFrame
     alerts = []
 
     # Vérifier chaque nouvelle transaction
-    for _, tx in df_new.iterrows():
-        tx_dict = tx.to_dict()
+    for tx_dict in df_new.to_dict("records"):
         new_alerts = manager.check_new_transaction(tx_dict, df_history)
         alerts.extend(new_alerts)
 
@@ -48,24 +47,23 @@ def analyze_imported_transactions(df_new: pd.DataFrame, df_history: pd.DataFrame
         df_combined = pd.concat([df_history, df_new], ignore_index=True)
         df_month = df_combined[df_combined["date_dt"].dt.strftime("%Y-%m") == current_month]
 
-        for _, budget in budgets.iterrows():
-            category = budget["category"]
-            budget_amount = budget["amount"]
+        # Dépenses du mois par catégorie, avant et après l'import (calculées une fois)
+        month_expenses = filter_expense_transactions(df_month)
+        spent_by_cat = (
+            month_expenses["amount"].abs().groupby(month_expenses["category_validated"]).sum()
+        )
+        old_expenses = filter_expense_transactions(df_history)
+        old_expenses = old_expenses[old_expenses["date_dt"].dt.strftime("%Y-%m") == current_month]
+        old_spent_by_cat = (
+            old_expenses["amount"].abs().groupby(old_expenses["category_validated"]).sum()
+        )
 
+        for category, budget_amount in zip(budgets["category"], budgets["amount"]):
             # Calculer les dépenses actuelles
-            spent = filter_expense_transactions(df_month)
-            spent = spent[spent["category_validated"] == category]["amount"].abs().sum()
+            spent = spent_by_cat.get(category, 0.0)
 
             # Vérifier si on vient de dépasser
-            old_spent = filter_expense_transactions(df_history)
-            old_spent = (
-                old_spent[
-                    (old_spent["category_validated"] == category)
-                    & (old_spent["date_dt"].dt.strftime("%Y-%m") == current_month)
-                ]["amount"]
-                .abs()
-                .sum()
-            )
+            old_spent = old_spent_by_cat.get(category, 0.0)
 
             # Si on dépasse maintenant mais pas avant
             if spent > budget_amount and old_spent <= budget_amount:
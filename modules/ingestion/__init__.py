@@ -18,6 +18,14 @@ from modules.ingestion.bank_templates import (
 )
 from modules.logger import logger
 
+# Gestion optionnelle de pyarrow (parser CSV multithread)
+try:
+    import pyarrow  # noqa: F401
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 def generate_tx_hash(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -42,20 +50,74 @@ def generate_tx_hash(df: pd.DataFrame) -> pd.DataFrame:
     # 1. Calculate local occurrence index (within the file)
     df["_local_occ"] = df.groupby(["date", "label", "amount"]).cumcount()
 
-    def calculate_hash(row):
-        # Hash is now purely based on content + local index.
-        # Deduplication against DB happens in data_manager.save_transactions by checking counts.
-        norm_label = str(row["label"]).strip().upper()
+    # Hash is purely based on content + local index.
+    # Deduplication against DB happens in data_manager.save_transactions by checking counts.
+    # UNIVERSAL SIGNATURE: We EXCLUDE account_label from the hash.
+    # This prevents duplicate imports if the same file is imported under a different account name.
+    # base = date + label + amount + index (built column-wise, no per-row apply)
+    norm_label = df["label"].astype(str).str.strip().str.upper()
+    base = (
+        df["date"].astype(str)
+        + "|"
+        + norm_label
+        + "|"
+        + df["amount"].astype(str)
+        + "|"
+        + df["_local_occ"].astype(str)
+    )
+
+    # Same SHA-256 digest as before so hashes already stored in the DB stay comparable;
+    # iterate a plain list with the constructor bound once (no per-row Series boxing)
+    sha256 = hashlib.sha256
+    df["tx_hash"] = [sha256(key.encode()).hexdigest()[:16] for key in base.tolist()]
+    return df.drop(columns=["_local_occ"])
+
 
-        # UNIVERSAL SIGNATURE: We EXCLUDE account_label from the hash.
-        # This prevents duplicate imports if the same file is imported under a different account name.
-        # base = date + label + amount + index
+# Low-cardinality text columns stored once per distinct value (category dtype).
+# 'amount' stays float64: float32 cannot represent cents exactly and would change
+# both the stored amounts and the tx_hash signature.
+_CATEGORICAL_COLUMNS = ("status", "category_validated", "account_label", "member")
 
-        base = f"{row['date']}|{norm_label}|{row['amount']}|{row['_local_occ']}"
-        return hashlib.sha256(base.encode()).hexdigest()[:16]
 
-    df["tx_hash"] = df.apply(calculate_hash, axis=1)
-    return df.drop(columns=["_local_occ"])
+def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store repeated text columns of a parsed import as pandas categoricals.
+
+    Args:
+        df: Parsed transactions DataFrame
+
+    Returns:
+        Same DataFrame with low-cardinality columns converted to 'category'
+    """
+    for col in _CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _read_csv(file, **kwargs) -> pd.DataFrame:
+    """
+    pd.read_csv using the pyarrow engine when it is installed and the options allow it.
+
+    The pyarrow engine does not support 'thousands'; such calls, and files the
+    pyarrow parser rejects, go through the default C engine.
+    """
+    if PYARROW_AVAILABLE and kwargs.get("thousands") is None:
+        try:
+            return pd.read_csv(file, engine="pyarrow", **kwargs)
+        except ValueError as e:
+            logger.debug(f"[Ingestion] pyarrow CSV engine failed, falling back: {e}")
+            file.seek(0)
+    return pd.read_csv(file, **kwargs)
+
+
+_CARD_SUFFIX_PATTERN = re.compile(r"CB\*(\d{4})", re.IGNORECASE)
+
+
+def _extract_card_suffixes(labels: pd.Series) -> pd.Series:
+    """Extract the 4-digit card suffix (CB*XXXX) of every label in one vectorized pass."""
+    suffixes = labels.astype(str).str.extract(_CARD_SUFFIX_PATTERN, expand=False)
+    return suffixes.astype(object).where(suffixes.notna(), None)
 
 
 def parse_bourso_csv(file) -> pd.DataFrame | None:
@@ -94,18 +156,14 @@ def parse_bourso_csv(file) -> pd.DataFrame | None:
             df_clean["amount"] = (
                 df_clean["amount"].str.replace(" ", "").str.replace(",", ".").astype(float)
             )
+        # Snap to whole cents so (date, label, amount) duplicate matching is exact
+        df_clean["amount"] = df_clean["amount"].round(2)
 
         df_clean["date"] = pd.to_datetime(df_clean["date"], format="%Y-%m-%d").dt.date
 
-        def extract_card_suffix(label):
-            match = re.search(r"CB\*(\d{4})", str(label), re.IGNORECASE)
-            if match:
-                return match.group(1)
-            return None
-
-        df_clean["card_suffix"] = df_clean["label"].apply(extract_card_suffix)
-        df_clean["member"] = df_clean["card_suffix"].apply(
-            lambda x: f"Carte {x}" if x else "Inconnu"
+        df_clean["card_suffix"] = _extract_card_suffixes(df_clean["label"])
+        df_clean["member"] = (
+            df_clean["card_suffix"].map("Carte {}".format, na_action="ignore").fillna("Inconnu")
         )
         df_clean["status"] = "pending"
         df_clean["category_validated"] = "Inconnu"
@@ -130,7 +188,7 @@ def parse_bourso_csv(file) -> pd.DataFrame | None:
             "member",
             "card_suffix",
         ]
-        return generate_tx_hash(df_clean[final_cols])
+        return compact_dtypes(generate_tx_hash(df_clean[final_cols]))
 
     except pd.errors.EmptyDataError:
         return None, "Le fichier CSV est vide"
@@ -182,7 +240,7 @@ def parse_generic_csv(file, config: dict[str, str | int | dict]) -> pd.DataFrame
     """
     try:
         # Load
-        df = pd.read_csv(
+        df = _read_csv(
             file,
             sep=config.get("sep", ";"),
             decimal=config.get("decimal", ","),
@@ -231,17 +289,15 @@ def parse_generic_csv(file, config: dict[str, str | int | dict]) -> pd.DataFrame
                 .str.replace(",", ".")
             )
             df_clean["amount"] = pd.to_numeric(df_clean["amount"], errors="coerce")
+        # Snap to whole cents so (date, label, amount) duplicate matching is exact
+        df_clean["amount"] = df_clean["amount"].round(2)
 
         if "member" not in df_clean.columns:
             # Member extraction (Generic regex for CB*XXXX is useful generally)
-            def extract_card_suffix_generic(label):
-                match = re.search(r"CB\*(\d{4})", str(label), re.IGNORECASE)
-                if match:
-                    return match.group(1)
-                return None
-
-            df_clean["card_suffix"] = df_clean["label"].apply(extract_card_suffix_generic)
-            df_clean["member"] = df_clean["card_suffix"].apply(lambda x: f"Carte {x}" if x else "")
+            df_clean["card_suffix"] = _extract_card_suffixes(df_clean["label"])
+            df_clean["member"] = (
+                df_clean["card_suffix"].map("Carte {}".format, na_action="ignore").fillna("")
+            )
         else:
             # If member was mapped from CSV, we don't have suffix usually
             df_clean["card_suffix"] = None
@@ -271,7 +327,7 @@ def parse_generic_csv(file, config: dict[str, str | int | dict]) -> pd.DataFrame
             if col not in df_clean.columns:
                 df_clean[col] = None
 
-        return generate_tx_hash(df_clean[final_cols])
+        return compact_dtypes(generate_tx_hash(df_clean[final_cols]))
 
     except pd.errors.EmptyDataError:
         return None, "Le fichier CSV est vide"
@@ -355,6 +411,7 @@ __all__ = [
     "parse_bourso_csv",
     "parse_generic_csv",
     "load_transaction_file",
+    "compact_dtypes",
     # Bank templates
     "BankTemplate",
     "BANK_TEMPLATES",
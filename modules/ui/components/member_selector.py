@@ -50,7 +50,7 @@ def render_member_selector(
     if extra_options is None:
         extra_options = ["Maison", "Famille"]
 
-    options = sorted(list(set(all_members + extra_options)))
+    options = sorted({*all_members, *extra_options})
 
     # Add current value if not in options
     if current_value and current_value not in options:
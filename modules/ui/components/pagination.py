@@ -107,7 +107,9 @@ def paginated_list(items: list, page_size: int = 10, key: str = "list_pagination
     if session_key not in st.session_state:
         st.session_state[session_key] = 1
 
-    current_page = st.session_state[session_key]
+    # La liste a pu rétrécir (filtres, taille de page) depuis le dernier rendu
+    current_page = min(st.session_state[session_key], total_pages)
+    st.session_state[session_key] = current_page
 
     # UI compacte
     cols = st.columns([1, 3, 1])
@@ -10,13 +10,13 @@ import pandas as pd
 import streamlit as st
 
 from modules.ai_manager import is_ai_available
-from modules.categorization import categorize_transaction
+from modules.categorization import categorize_columns
 from modules.db.categories import add_category, get_categories
 from modules.db.members import add_member, get_members
 from modules.db.rules import add_learning_rule
 from modules.db.transactions import (
     bulk_update_transaction_status,
-    get_all_hashes,
+    get_existing_hashes,
     get_pending_transactions,
     save_transactions,
 )
@@ -58,46 +58,54 @@ def render_quick_validation_popover():
         member_names = members["name"].tolist() if not members.empty else []
         categories = get_categories()
 
+        # Options built once for all rows (position lookup instead of list.index)
+        member_options = [""] + member_names
+        category_positions = {cat: i for i, cat in enumerate(categories)}
+
         # Show up to 5 transactions
         display_df = df.head(5)
         validated_count = 0
 
-        for idx, row in display_df.iterrows():
+        # Colonnes extraites une fois, parcourues positionnellement (pas de Series par ligne)
+        tx_ids = display_df["id"].to_numpy()
+        labels = display_df["label"].to_numpy()
+        dates = display_df["date"].to_numpy()
+        amounts = display_df["amount"].to_numpy()
+        current_cats = display_df["category_validated"].to_numpy()
+
+        for tx_id, label, date, amount, category_validated in zip(
+            tx_ids, labels, dates, amounts, current_cats
+        ):
             with st.container(border=True):
                 cols = st.columns([2, 1, 1, 0.5])
 
                 with cols[0]:
-                    st.write(
-                        f"**{row['label'][:40]}...**"
-                        if len(row["label"]) > 40
-                        else f"**{row['label']}**"
-                    )
-                    st.caption(f"{row['date']} • {row['amount']:.2f} €")
+                    st.write(f"**{label[:40]}...**" if len(label) > 40 else f"**{label}**")
+                    st.caption(f"{date} • {amount:.2f} €")
 
                 with cols[1]:
-                    cat_key = f"quick_cat_{row['id']}"
+                    cat_key = f"quick_cat_{tx_id}"
                     current_cat = (
-                        row.get("category_validated")
-                        if row.get("category_validated") != "Inconnu"
+                        category_validated
+                        if category_validated != "Inconnu"
                         else categories[0] if categories else "Inconnu"
                     )
                     selected_cat = st.selectbox(
                         "Catégorie",
                         options=categories,
-                        index=categories.index(current_cat) if current_cat in categories else 0,
+                        index=category_positions.get(current_cat, 0),
                         key=cat_key,
                         label_visibility="collapsed",
                     )
 
                 with cols[2]:
-                    mem_key = f"quick_mem_{row['id']}"
-                    member_options = [""] + member_names
+                    mem_key = f"quick_mem_{tx_id}"
                     selected_member = st.selectbox(
                         "Payeur", options=member_options, key=mem_key, label_visibility="collapsed"
                     )
 
                 with cols[3]:
-                    if st.button("✓", key=f"quick_val_{row['id']}", type="primary"):
+                    if st.button("✓", key=f"quick_val_{tx_id}", type="primary"):
                         tags = None
                         beneficiary = None
                         if selected_member:
@@ -105,11 +113,11 @@ def render_quick_validation_popover():
                             beneficiary = selected_member
 
                         bulk_update_transaction_status(
-                            [row["id"]], selected_cat, tags=tags, beneficiary=beneficiary
+                            [int(tx_id)], selected_cat, tags=tags, beneficiary=beneficiary
                         )
                         validated_count += 1
                         flash_message(
-                            f"✅ Transaction validée : {row['label'][:30]}...", FeedbackType.SUCCESS
+                            f"✅ Transaction validée : {label[:30]}...", FeedbackType.SUCCESS
                         )
                         st.rerun()
 
@@ -282,7 +290,7 @@ def render_quick_import_popover():
 
         if uploaded_file is not None:
             # Account selection
-            from modules.db.transactions import get_all_account_labels
+            from modules.db.stats import get_all_account_labels
 
             existing_accounts = get_all_account_labels()
 
@@ -302,7 +310,7 @@ def render_quick_import_popover():
                     return
 
                 # Check for duplicates
-                existing_hashes = get_all_hashes()
+                existing_hashes = get_existing_hashes(df["tx_hash"].tolist())
                 if existing_hashes:
                     duplicates_mask = df["tx_hash"].isin(existing_hashes)
                     num_duplicates = duplicates_mask.sum()
@@ -333,15 +341,12 @@ def render_quick_import_popover():
                     key="button_261",
                 ):
                     with st.spinner("🔄 Import en cours..."):
-                        # Categorize
-                        results = []
-                        for _, row in df.iterrows():
-                            cat, source, conf = categorize_transaction(
-                                row["label"], row["amount"], row["date"]
-                            )
-                            results.append(cat)
+                        # Categorize (whole columns at once, no per-row loop)
+                        categories, _, _ = categorize_columns(
+                            df["label"].to_numpy(), df["amount"].to_numpy(), df["date"].to_numpy()
+                        )
 
-                        df["category_validated"] = results
+                        df["category_validated"] = categories
                         df["account_label"] = account
 
                         # Save
@@ -409,11 +414,12 @@ def render_quick_stats_popover():
         st.divider()
         st.caption("Top catégories de dépenses")
 
-        expenses_df = filter_expense_transactions(month_df).copy()
+        expenses_df = filter_expense_transactions(month_df)
         if not expenses_df.empty:
-            expenses_df["amount_abs"] = expenses_df["amount"].abs()
             top_cats = (
-                expenses_df.groupby("category_validated")["amount_abs"]
+                expenses_df["amount"]
+                .abs()
+                .groupby(expenses_df["category_validated"])
                 .sum()
                 .sort_values(ascending=False)
                 .head(3)
@@ -62,14 +62,7 @@ def render_tag_selector_compact(
 
     # Build options list (must include current tags to avoid errors)
     all_available = sorted(
-        list(
-            set(
-                existing_tags
-                + suggested
-                + st.session_state["temp_custom_tags"]
-                + current_tags  # Ensure current tags are always in options
-            )
-        )
+        set(existing_tags).union(suggested, st.session_state["temp_custom_tags"], current_tags)
     )
 
     # Determine quick tags (suggestions not already selected)
@@ -253,7 +253,7 @@ def render_smart_tag_selector(
 
     # Build options list
     all_available = sorted(
-        list(set(existing_tags + suggested + st.session_state["temp_custom_tags"] + current_tags))
+        set(existing_tags).union(suggested, st.session_state["temp_custom_tags"], current_tags)
     )
 
     # Determine quick tags
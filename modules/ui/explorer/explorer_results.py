@@ -110,8 +110,8 @@ def render_transactions_table(df: pd.DataFrame, key_prefix: str = "explorer"):
 def _render_bulk_actions(selected_ids: list[int], key_prefix: str):
     """Render a dedicated action bar for bulk updates."""
     from modules.db.categories import get_categories
-    from modules.db.members import get_members
-    from modules.db.transactions import bulk_update_transaction_status, update_transaction_member
+    from modules.db.members import bulk_update_transaction_members, get_members
+    from modules.db.transactions import bulk_update_transaction_status
 
     st.markdown(f"### 🛠️ Action groupée ({len(selected_ids)} transactions)")
 
@@ -150,8 +150,7 @@ def _render_bulk_actions(selected_ids: list[int], key_prefix: str):
             use_container_width=True,
         ):
             with st.spinner("Mise à jour..."):
-                for tx_id in selected_ids:
-                    update_transaction_member(tx_id, new_member)
+                bulk_update_transaction_members(selected_ids, new_member)
             st.toast(f"✅ {len(selected_ids)} membres mis à jour !", icon="👤")
             st.rerun()
 
@@ -164,17 +163,24 @@ def _render_bulk_actions(selected_ids: list[int], key_prefix: str):
             use_container_width=True,
         ):
             from modules.db.members import detect_member_from_content
-            from modules.db.transactions import get_all_transactions, update_transaction_member
+            from modules.db.transactions import get_all_transactions
 
             all_tx = get_all_transactions(filters={"id": ("IN", tuple(selected_ids))})
-            count = 0
-            for _, row in all_tx.iterrows():
-                new_m = detect_member_from_content(
-                    row["label"], row["card_suffix"], row["account_label"]
-                )
-                if new_m != row["member"]:
-                    update_transaction_member(row["id"], new_m)
-                    count += 1
+            # Regroupe les corrections par membre : un UPDATE ... IN (...) par membre
+            ids_by_member = {}
+            for tx_id, label, card_suffix, account_label, member in zip(
+                all_tx["id"],
+                all_tx["label"],
+                all_tx["card_suffix"],
+                all_tx["account_label"],
+                all_tx["member"],
+            ):
+                new_m = detect_member_from_content(label, card_suffix, account_label)
+                if new_m != member:
+                    ids_by_member.setdefault(new_m, []).append(int(tx_id))
+            for new_m, tx_ids in ids_by_member.items():
+                bulk_update_transaction_members(tx_ids, new_m)
+            count = sum(len(tx_ids) for tx_ids in ids_by_member.values())
             st.toast(f"✅ {count} membres corrigés !", icon="🧠")
             st.rerun()
 
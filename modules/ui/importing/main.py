@@ -1,12 +1,14 @@
 import datetime
+import io
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-from modules.categorization import categorize_transaction_batch
-from modules.db.stats import get_all_account_labels, get_recent_imports
-from modules.db.transactions import get_all_hashes, get_all_transactions, save_transactions
-from modules.ingestion import load_transaction_file
+from modules.db.stats import get_all_account_labels, get_recent_imports, is_app_initialized
+from modules.db.transactions import get_existing_hashes, save_transactions
+from modules.db.transactions_batch import batch_categorize_transactions
+from modules.ingestion import compact_dtypes, load_transaction_file
 from modules.logger import logger
 from modules.onboarding import render_onboarding_widget
 from modules.ui.importing.preview import (
@@ -17,12 +19,38 @@ from modules.ui.importing.preview import (
 from modules.utils import validate_csv_file
 
 
+@st.cache_data(show_spinner=False)
+def _sniff_header(file_bytes: bytes, sep: str, skiprows: int) -> list[str]:
+    """Read only the CSV header row (no data rows, no dtype inference)."""
+    return pd.read_csv(io.BytesIO(file_bytes), sep=sep, skiprows=skiprows, nrows=0).columns.tolist()
+
+
+@st.cache_data(show_spinner=False)
+def _load_transaction_file_cached(file_bytes: bytes, mode: str, config: dict | None):
+    """Parse the uploaded file once per (content, mode, config); reruns hit the cache."""
+    return load_transaction_file(io.BytesIO(file_bytes), mode=mode, config=config)
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _existing_hashes_cached(file_bytes: bytes, mode: str, config: dict | None) -> set[str]:
+    """
+    tx_hash values of the parsed file already stored in the database.
+
+    Keyed like the parse, so fragment reruns (force-import toggle, preview
+    options) do not query the DB again. save_transactions clears all data
+    caches after an import; the short TTL covers edits made elsewhere.
+    """
+    df = _load_transaction_file_cached(file_bytes, mode, config)
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        return set()
+    return get_existing_hashes(df["tx_hash"].tolist())
+
+
 def render_import_tab():
     """Renders the Importation tab content."""
 
-    # Onboarding for new users
-    df_check = get_all_transactions()
-    render_onboarding_widget("default", has_data=not df_check.empty)
+    # Onboarding for new users (existence check only, no full table load)
+    render_onboarding_widget("default", has_data=is_app_initialized())
 
     st.header("📥 Importation des relevés")
 
@@ -164,13 +192,14 @@ def render_import_tab():
             st.error(f"⚠️ Fichier invalide : {error_msg}")
             return
 
+        # Read the upload once; header sniffing and parsing both work on these bytes
+        file_bytes = uploaded_file.getvalue()
+
         # Handle Column Mapping for Custom Mode
         if import_mode == "custom":
             st.info("Veuillez mapper les colonnes de votre fichier.")
             try:
-                uploaded_file.seek(0)
-                preview_df = pd.read_csv(uploaded_file, sep=sep, skiprows=skiprows, nrows=2)
-                cols = preview_df.columns.tolist()
+                cols = _sniff_header(file_bytes, sep, skiprows)
 
                 c1, c2, c3, c4 = st.columns(4)
                 with c1:
@@ -264,214 +293,257 @@ def render_import_tab():
             # Passer à l'étape 3 (Preview)
             st.session_state.import_step = 3
 
-            # Parse file
-            st.divider()
-            st.subheader("3️⃣ Prévisualisation & Doublons")
+            _render_preview_and_import(
+                file_bytes,
+                selected_bank_key,
+                config,
+                selected_year,
+                selected_month,
+                months,
+                account_name,
+            )
 
-            try:
-                mode_arg = "bourso_preset" if selected_bank_key == "boursorama" else "custom"
-                df = load_transaction_file(uploaded_file, mode=mode_arg, config=config)
 
-                if isinstance(df, tuple):
-                    st.error(f"Erreur lors de la lecture : {df[1]}")
+@st.fragment
+def _render_preview_and_import(
+    file_bytes: bytes,
+    selected_bank_key: str | None,
+    config: dict | None,
+    selected_year: int,
+    selected_month: str,
+    months: list[str],
+    account_name: str,
+):
+    """
+    Steps 3 and 4 (preview, duplicates, import) of the import wizard.
+
+    Runs as a fragment: widgets inside it (force import, preview options)
+    only rerun this section instead of the whole import tab.
+    """
+    # Parse file
+    st.divider()
+    st.subheader("3️⃣ Prévisualisation & Doublons")
+
+    try:
+        mode_arg = "bourso_preset" if selected_bank_key == "boursorama" else "custom"
+        df = _load_transaction_file_cached(file_bytes, mode_arg, config)
+
+        if isinstance(df, tuple):
+            st.error(f"Erreur lors de la lecture : {df[1]}")
+            return
+        elif df is not None:
+            # Apply period filter as one [start, end) mask on a datetime64 view;
+            # the date column itself keeps its date objects (no round trip)
+            dates = pd.to_datetime(df["date"]).to_numpy()
+            if selected_month != "Tous":
+                month_num = months.index(selected_month)
+                period_start = np.datetime64(f"{selected_year}-{month_num:02d}", "M")
+                period_end = period_start + np.timedelta64(1, "M")
+            else:
+                period_start = np.datetime64(f"{selected_year}-01", "M")
+                period_end = period_start + np.timedelta64(12, "M")
+            df = df[(dates >= period_start) & (dates < period_end)]
+
+            if df.empty:
+                st.warning(f"Aucune transaction trouvée pour {selected_month} {selected_year}.")
+                return
+
+            period_label = selected_month if selected_month != "Tous" else "toute l'année"
+            st.info(f"📊 {len(df)} transactions trouvées pour {period_label} {selected_year}.")
+
+            # --- DUPLICATE DETECTION ---
+            # Only the hashes of this file are looked up in the DB (once per file)
+            existing_hashes = _existing_hashes_cached(file_bytes, mode_arg, config)
+            force_import = False
+
+            # Initialiser duplicates_mask par défaut
+            duplicates_mask = pd.Series(False, index=df.index)
+            num_duplicates = 0
+            num_new = len(df)
+
+            if existing_hashes:
+                duplicates_mask = df["tx_hash"].isin(existing_hashes)
+                num_duplicates = duplicates_mask.sum()
+                num_new = len(df) - num_duplicates
+
+                if num_duplicates > 0:
+                    st.warning(f"⚠️ **{num_duplicates} doublon(s) détecté(s)**")
+                    force_import = st.checkbox(
+                        "Forcer l'import (ignorer les doublons)", value=False
+                    )
+
+                if num_new == 0 and not force_import:
+                    st.error("❌ Toutes les transactions sont déjà importées !")
                     return
-                elif df is not None:
-                    # Apply period filter
-                    df["date"] = pd.to_datetime(df["date"])
-                    df = df[df["date"].dt.year == selected_year]
 
-                    if selected_month != "Tous":
-                        month_num = months.index(selected_month)
-                        df = df[df["date"].dt.month == month_num]
+            # --- STEP 3: PROFESSIONAL PREVIEW ---
+            st.session_state.import_step = 3
 
-                    df["date"] = df["date"].dt.date
+            # Préparer les données pour le composant de preview
+            detected_bank = (
+                "BoursoBank" if selected_bank_key == "boursorama" else "Banque personnalisée"
+            )
+            # Vue d'affichage seulement : la sélection .loc renvoie déjà un nouvel objet
+            duplicates_df = (
+                df.loc[duplicates_mask, ["date", "label", "amount"]]
+                if existing_hashes and num_duplicates > 0
+                else None
+            )
 
-                    if df.empty:
-                        st.warning(
-                            f"Aucune transaction trouvée pour {selected_month} {selected_year}."
-                        )
-                        return
+            # Callbacks pour les actions
+            def on_import_confirmed(df_to_import, options):
+                """Callback quand l'utilisateur confirme l'import."""
+                st.session_state["import_confirmed"] = True
+                st.session_state["df_to_import"] = df_to_import
+                st.session_state["import_options"] = options
+                st.session_state["account_name"] = account_name
+
+            def on_import_cancelled():
+                """Callback quand l'utilisateur annule."""
+                st.session_state["import_cancelled"] = True
+
+            # Afficher le preview professionnel
+            render_import_preview(
+                df=df,
+                detected_bank=detected_bank,
+                duplicates=duplicates_df,
+                on_confirm=on_import_confirmed,
+                on_cancel=on_import_cancelled,
+                key="import_preview_main",
+            )
 
-                    period_label = selected_month if selected_month != "Tous" else "toute l'année"
-                    st.info(
-                        f"📊 {len(df)} transactions trouvées pour {period_label} {selected_year}."
-                    )
+            # Gérer les actions du preview
+            if st.session_state.get("import_cancelled"):
+                st.session_state["import_cancelled"] = False
+                st.session_state.import_step = 0
+                st.rerun()
 
-                    # --- DUPLICATE DETECTION ---
-                    existing_hashes = get_all_hashes()
-                    force_import = False
-
-                    # Initialiser duplicates_mask par défaut
-                    duplicates_mask = pd.Series(False, index=df.index)
-                    num_duplicates = 0
-                    num_new = len(df)
-
-                    if existing_hashes:
-                        duplicates_mask = df["tx_hash"].isin(existing_hashes)
-                        num_duplicates = duplicates_mask.sum()
-                        num_new = len(df) - num_duplicates
-
-                        if num_duplicates > 0:
-                            st.warning(f"⚠️ **{num_duplicates} doublon(s) détecté(s)**")
-                            force_import = st.checkbox(
-                                "Forcer l'import (ignorer les doublons)", value=False
-                            )
-
-                        if num_new == 0 and not force_import:
-                            st.error("❌ Toutes les transactions sont déjà importées !")
-                            return
-
-                    # --- STEP 3: PROFESSIONAL PREVIEW ---
-                    st.session_state.import_step = 3
-
-                    # Préparer les données pour le composant de preview
-                    detected_bank = (
-                        "BoursoBank"
-                        if selected_bank_key == "boursorama"
-                        else "Banque personnalisée"
-                    )
-                    duplicates_df = (
-                        df[duplicates_mask].copy()
-                        if existing_hashes and num_duplicates > 0
-                        else None
+            if st.session_state.get("import_confirmed"):
+                df_import = st.session_state["df_to_import"]
+                options = st.session_state["import_options"]
+                auto_cat = options.get("auto_categorize", True)
+                options.get("skip_validation", False)
+
+                # Réinitialiser les flags
+                st.session_state["import_confirmed"] = False
+
+                # Passer à l'étape 4 (Import)
+                st.session_state.import_step = 4
+
+                # --- STEP 4: IMPORT AVEC PROGRESSION ---
+                st.divider()
+                st.subheader("4️⃣ Import des données")
+
+                # Étapes d'import pour la barre de progression
+                import_steps = [
+                    "Préparation des données",
+                    "Catégorisation automatique",
+                    "Enregistrement en base",
+                    "Finalisation",
+                ]
+
+                errors = []
+                categorized_count = 0
+
+                with st.container():
+                    # Étape 1: Préparation
+                    show_import_progress(1, len(import_steps), import_steps[0])
+
+                    # Les doublons connus ne sont pas catégorisés. Ils restent dans le lot :
+                    # save_transactions les écarte par comptage (date, libellé, montant) et
+                    # conserve ainsi les opérations identiques du même jour pas encore en base
+                    is_duplicate = np.zeros(len(df_import), dtype=bool)
+                    if (
+                        existing_hashes
+                        and not force_import
+                        and options.get("ignore_duplicates", True)
+                    ):
+                        is_duplicate = df_import["tx_hash"].isin(existing_hashes).to_numpy()
+
+                    # Étape 2: Catégorisation (si activée)
+                    if auto_cat:
+                        show_import_progress(2, len(import_steps), import_steps[1])
+
+                        # Seules les lignes sans catégorie passent par le moteur
+                        categories = (
+                            df_import["category_validated"]
+                            .astype(object)
+                            .fillna("Inconnu")
+                            .to_numpy(copy=True)
+                        )
+                        statuses = df_import["status"].astype(object).to_numpy(copy=True)
+                        confidences = np.zeros(len(df_import))
+                        needs_cat = (categories == "Inconnu") & ~is_duplicate
+
+                        # Catégorisation vectorisée, progression mise à jour par bloc
+                        progress_bar = st.progress(0)
+
+                        if needs_cat.any():
+                            try:
+                                results = batch_categorize_transactions(
+                                    df_import.loc[needs_cat, ["label", "amount", "date"]],
+                                    use_ai=False,
+                                    progress_callback=lambda done, total: progress_bar.progress(
+                                        done / total
+                                    ),
+                                )
+                                categories[needs_cat] = results["category_validated"].to_numpy()
+                                confidences[needs_cat] = results["ai_confidence"].to_numpy()
+                                statuses[needs_cat] = results["status"].to_numpy()
+                            except Exception as e:
+                                logger.error(f"Batch categorization failed: {e}")
+                                # Fallback: marquer tout comme Inconnu
+                                categories[needs_cat] = "Inconnu"
+                                confidences[needs_cat] = 0.0
+                                statuses[needs_cat] = "pending"
+
+                            categorized_count = int((categories[needs_cat] != "Inconnu").sum())
+                        progress_bar.progress(1.0)
+
+                        df_import["category_validated"] = categories
+                        df_import["ai_confidence"] = confidences
+                        df_import["status"] = statuses
+                    else:
+                        # Sans catégorisation auto
+                        df_import["category_validated"] = "Inconnu"
+                        df_import["ai_confidence"] = 0.0
+                        df_import["status"] = "pending"
+
+                    # Étape 3: Enregistrement
+                    show_import_progress(3, len(import_steps), import_steps[2])
+                    # Un seul libellé de compte : codes int8 plutôt que N références texte
+                    df_import["account_label"] = pd.Categorical.from_codes(
+                        np.zeros(len(df_import), dtype=np.int8), categories=[account_name]
                     )
+                    count, skipped = save_transactions(compact_dtypes(df_import))
 
-                    # Callbacks pour les actions
-                    def on_import_confirmed(df_to_import, options):
-                        """Callback quand l'utilisateur confirme l'import."""
-                        st.session_state["import_confirmed"] = True
-                        st.session_state["df_to_import"] = df_to_import
-                        st.session_state["import_options"] = options
-                        st.session_state["account_name"] = account_name
-
-                    def on_import_cancelled():
-                        """Callback quand l'utilisateur annule."""
-                        st.session_state["import_cancelled"] = True
-
-                    # Afficher le preview professionnel
-                    render_import_preview(
-                        df=df,
-                        detected_bank=detected_bank,
-                        duplicates=duplicates_df,
-                        on_confirm=on_import_confirmed,
-                        on_cancel=on_import_cancelled,
-                        key="import_preview_main",
+                    # Étape 4: Finalisation
+                    show_import_progress(4, len(import_steps), import_steps[3])
+
+                    # Afficher le résumé professionnel
+                    show_import_summary(
+                        imported=count,
+                        categorized=categorized_count,
+                        duplicates_skipped=skipped,
+                        errors=errors,
                     )
 
-                    # Gérer les actions du preview
-                    if st.session_state.get("import_cancelled"):
-                        st.session_state["import_cancelled"] = False
-                        st.session_state.import_step = 0
+                    # Redirection vers validation si succès
+                    if count > 0:
+                        st.session_state["just_imported"] = True
                         st.rerun()
 
-                    if st.session_state.get("import_confirmed"):
-                        df_import = st.session_state["df_to_import"]
-                        options = st.session_state["import_options"]
-                        auto_cat = options.get("auto_categorize", True)
-                        options.get("skip_validation", False)
-
-                        # Réinitialiser les flags
-                        st.session_state["import_confirmed"] = False
-
-                        # Passer à l'étape 4 (Import)
-                        st.session_state.import_step = 4
-
-                        # --- STEP 4: IMPORT AVEC PROGRESSION ---
-                        st.divider()
-                        st.subheader("4️⃣ Import des données")
-
-                        # Étapes d'import pour la barre de progression
-                        import_steps = [
-                            "Préparation des données",
-                            "Catégorisation automatique",
-                            "Enregistrement en base",
-                            "Finalisation",
-                        ]
-
-                        errors = []
-                        categorized_count = 0
-
-                        with st.container():
-                            # Étape 1: Préparation
-                            show_import_progress(1, len(import_steps), import_steps[0])
-
-                            # Étape 2: Catégorisation (si activée)
-                            if auto_cat:
-                                show_import_progress(2, len(import_steps), import_steps[1])
-
-                                # Préparer les données pour le batch
-                                tx_data = [
-                                    (row["label"], row["amount"], row["date"])
-                                    for _, row in df_import.iterrows()
-                                ]
-
-                                # Catégorisation en batch (beaucoup plus rapide)
-                                progress_bar = st.progress(0)
-                                update_interval = max(1, len(tx_data) // 20)  # Tous les 5%
-
-                                try:
-                                    all_results = categorize_transaction_batch(tx_data)
-                                    categorized_count = len(
-                                        [r for r in all_results if r[0] != "Inconnu"]
-                                    )
-
-                                    # Simuler une progression pour l'UX
-                                    for i in range(0, len(tx_data), update_interval):
-                                        progress_bar.progress(
-                                            min((i + update_interval) / len(tx_data), 1.0)
-                                        )
-
-                                except Exception as e:
-                                    logger.error(f"Batch categorization failed: {e}")
-                                    # Fallback: marquer tout comme Inconnu
-                                    all_results = [("Inconnu", "error", 0.0)] * len(tx_data)
-
-                                df_import["category_validated"] = [
-                                    r[0] if r[0] else "Inconnu" for r in all_results
-                                ]
-                                df_import["ai_confidence"] = [r[2] for r in all_results]
-                                df_import["status"] = [
-                                    "validated" if r[1] == "rule" else "pending"
-                                    for r in all_results
-                                ]
-                            else:
-                                # Sans catégorisation auto
-                                df_import["category_validated"] = "Inconnu"
-                                df_import["ai_confidence"] = 0.0
-                                df_import["status"] = "pending"
-
-                            # Étape 3: Enregistrement
-                            show_import_progress(3, len(import_steps), import_steps[2])
-                            df_import["account_label"] = account_name
-                            count, skipped = save_transactions(df_import)
-
-                            # Étape 4: Finalisation
-                            show_import_progress(4, len(import_steps), import_steps[3])
-
-                            # Afficher le résumé professionnel
-                            show_import_summary(
-                                imported=count,
-                                categorized=categorized_count,
-                                duplicates_skipped=skipped,
-                                errors=errors,
-                            )
-
-                            # Redirection vers validation si succès
-                            if count > 0:
-                                st.session_state["just_imported"] = True
-                                st.rerun()
-
-            except pd.errors.ParserError as e:
-                logger.error(f"CSV parse error: {e}")
-                st.error(f"❌ Format CSV invalide : {e}")
-            except ValueError as e:
-                logger.error(f"Validation error: {e}")
-                st.error(f"❌ Données invalides : {e}")
-            except KeyError as e:
-                logger.error(f"Missing column error: {e}")
-                st.error(f"❌ Colonne manquante dans le fichier : {e}")
-            except Exception as e:
-                logger.exception(f"Unexpected error during import: {e}")
-                st.error(
-                    "❌ Une erreur inattendue s'est produite. Veuillez réessayer ou contacter le support."
-                )
+    except pd.errors.ParserError as e:
+        logger.error(f"CSV parse error: {e}")
+        st.error(f"❌ Format CSV invalide : {e}")
+    except ValueError as e:
+        logger.error(f"Validation error: {e}")
+        st.error(f"❌ Données invalides : {e}")
+    except KeyError as e:
+        logger.error(f"Missing column error: {e}")
+        st.error(f"❌ Colonne manquante dans le fichier : {e}")
+    except Exception as e:
+        logger.exception(f"Unexpected error during import: {e}")
+        st.error(
+            "❌ Une erreur inattendue s'est produite. Veuillez réessayer ou contacter le support."
+        )
@@ -68,15 +68,13 @@ def render_import_preview(
     # Aperçu des transactions
     st.markdown("#### 📋 Aperçu des transactions (5 premières lignes)")
 
-    preview_df = df.head(5).copy()
-
-    # Format pour affichage
+    # Format pour affichage (sélection de colonnes sur la tête, sans copie intermédiaire)
     display_cols = (
         ["date", "label", "amount", "category_validated"]
-        if "category_validated" in preview_df.columns
+        if "category_validated" in df.columns
         else ["date", "label", "amount"]
     )
-    st.dataframe(preview_df[display_cols], use_container_width=True)
+    st.dataframe(df.head(5)[display_cols], use_container_width=True)
 
     # Statistiques rapides
     if "amount" in df.columns:
@@ -229,15 +227,13 @@ def format_preview_dataframe(df: pd.DataFrame, max_rows: int = 5) -> pd.DataFram
     if df.empty:
         return df
 
-    preview_df = df.head(max_rows).copy()
-
-    # Select display columns if they exist
+    # Select display columns if they exist (column selection already returns a new frame)
     display_cols = ["date", "label", "amount"]
-    if "category_validated" in preview_df.columns:
+    if "category_validated" in df.columns:
         display_cols.append("category_validated")
 
-    available_cols = [col for col in display_cols if col in preview_df.columns]
-    return preview_df[available_cols]
+    available_cols = [col for col in display_cols if col in df.columns]
+    return df.head(max_rows)[available_cols]
 
 
 def show_import_summary(imported: int, categorized: int, duplicates_skipped: int, errors: list):
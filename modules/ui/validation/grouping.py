@@ -5,9 +5,13 @@ Pure business logic for smart grouping of pending transactions.
 
 import re
 
+import numpy as np
 import pandas as pd
 
-from modules.utils import clean_label
+from modules.utils import clean_label_series
+
+# Cheque labels are grouped by label + amount (one group per cheque)
+_CHEQUE_RE = re.compile(r"\b(?:CHQ|CHEQUE|REMISE\s+CHEQUE|REMISE\s+CHQ)\b")
 
 
 def get_smart_groups(df: pd.DataFrame, excluded_ids: set[int] = None) -> pd.DataFrame:
@@ -40,26 +44,25 @@ def get_smart_groups(df: pd.DataFrame, excluded_ids: set[int] = None) -> pd.Data
     if excluded_ids is None:
         excluded_ids = set()
 
-    def get_group_key(row):
-        # Check if ungrouped (DB flag or session state)
-        is_ungrouped_db = row.get("is_manually_ungrouped", 0) == 1
-        if is_ungrouped_db or row["id"] in excluded_ids:
-            return f"single_{row['id']}"
-
-        label_upper = str(row["label"]).upper()
+    ids = df["id"].astype(int)
+    labels = df["label"].astype(str)
+    cleaned = clean_label_series(labels)
 
-        # Special handling for cheques: group by label + amount
-        if re.search(r"\b(CHQ|CHEQUE|REMISE\s+CHEQUE|REMISE\s+CHQ)\b", label_upper):
-            return f"{clean_label(row['label'])} | {row['amount']:.2f} €"
+    # Special handling for cheques: group by label + amount
+    is_cheque = labels.str.upper().str.contains(_CHEQUE_RE)
+    cheque_keys = cleaned + " | " + df["amount"].map("{:.2f} €".format)
 
-        # Default: group by cleaned label
-        return clean_label(row["label"])
+    # Ungrouped (DB flag or session state): one group per transaction
+    ungrouped = ids.isin(excluded_ids)
+    if "is_manually_ungrouped" in df.columns:
+        ungrouped |= df["is_manually_ungrouped"] == 1
+    single_keys = "single_" + ids.astype(str)
 
-    result = df.copy()
-    result["id"] = result["id"].astype(int)
-    result["clean_group"] = result.apply(get_group_key, axis=1)
-
-    return result
+    # Default: group by cleaned label (assign returns the new frame, df is left untouched)
+    return df.assign(
+        id=ids,
+        clean_group=np.where(ungrouped, single_keys, np.where(is_cheque, cheque_keys, cleaned)),
+    )
 
 
 def calculate_group_stats(df: pd.DataFrame) -> pd.DataFrame:
@@ -77,18 +80,18 @@ def calculate_group_stats(df: pd.DataFrame) -> pd.DataFrame:
         >>> stats = calculate_group_stats(grouped)
         >>> stats[['clean_group', 'count', 'max_amount']]
     """
+    # Named aggregations only: the abs() is taken once up front instead of
+    # a lambda per group, so the whole groupby stays on the Cython path.
+    # Group keys are left unsorted, sort_groups orders them afterwards.
     stats = (
-        df.groupby("clean_group")
-        .agg({"id": "size", "date": "max", "amount": lambda x: x.abs().max()})
+        df.assign(abs_amount=df["amount"].abs())
+        .groupby("clean_group", sort=False)
+        .agg(count=("id", "size"), max_date=("date", "max"), max_amount=("abs_amount", "max"))
         .reset_index()
     )
 
-    stats.columns = ["clean_group", "count", "max_date", "max_amount"]
-
     # Mark single transactions (manually ungrouped)
-    stats["is_single"] = stats["clean_group"].apply(
-        lambda x: 1 if str(x).startswith("single_") else 0
-    )
+    stats["is_single"] = stats["clean_group"].astype(str).str.startswith("single_").astype(np.int8)
 
     return stats
 
@@ -104,4 +107,40 @@ def get_group_transactions(df: pd.DataFrame, group_name: str) -> pd.DataFrame:
     Returns:
         DataFrame containing only transactions from that group
     """
-    return df[df["clean_group"] == group_name].copy()
+    return df[df["clean_group"] == group_name]
+
+
+def build_group_summary(df: pd.DataFrame, group_names: list[str]) -> pd.DataFrame:
+    """
+    Build one summary row per group, in the order of group_names.
+
+    Each group is represented by its first transaction (id, date, label,
+    category, member, card suffix) plus the group size and total amount.
+
+    Args:
+        df: DataFrame with 'clean_group' column
+        group_names: Groups to summarize (e.g. the current page)
+
+    Returns:
+        DataFrame indexed by clean_group with columns:
+        id, date, label, count, total_amount, category, member, card_suffix
+    """
+    subset = df[df["clean_group"].isin(group_names)]
+    grouped = subset.groupby("clean_group", sort=False)
+    first = subset.drop_duplicates("clean_group").set_index("clean_group")
+
+    def column(name: str) -> pd.Series:
+        if name in first.columns:
+            return first[name]
+        return pd.Series(None, index=first.index, dtype=object)
+
+    summary = first[["id", "date", "label"]].copy()
+    summary["count"] = grouped.size()
+    summary["total_amount"] = grouped["amount"].sum()
+    category = column("category_validated")
+    category = category.mask(category == "")
+    summary["category"] = category.fillna(column("original_category"))
+    summary["member"] = column("member").fillna("")
+    summary["card_suffix"] = column("card_suffix")
+
+    return summary.reindex(group_names)
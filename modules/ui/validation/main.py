@@ -1,14 +1,16 @@
 import re
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 
 from modules.db.categories import (
     get_categories_with_emojis,
 )
-from modules.db.members import get_member_mappings, get_members, update_transaction_member
-from modules.db.rules import add_learning_rule
+from modules.db.members import get_member_mappings, get_members
+from modules.db.rules import add_learning_rules
 from modules.db.transactions import (
-    bulk_update_transaction_status,
+    bulk_validate_transactions,
     get_pending_transactions,
 )
 from modules.ui import toast_success, toast_warning
@@ -17,24 +19,54 @@ from modules.ui import toast_success, toast_warning
 from modules.ui.components.pagination import paginated_list
 from modules.ui.components.progress_tracker import render_progress_tracker
 from modules.ui.feedback import validation_feedback
-from modules.ui.validation.grouping import calculate_group_stats, get_smart_groups
-from modules.ui.validation.row_view import render_validation_row
+from modules.ui.validation.grouping import (
+    build_group_summary,
+    calculate_group_stats,
+    get_smart_groups,
+)
 from modules.ui.validation.sorting import get_sort_options, sort_groups
 
-
-def validate_with_memory(
-    tx_ids, label, category, remember, member_update=None, tags=None, beneficiary=None
-):
-    if remember:
-        pattern = re.sub(r"(?i)CARTE|CB\*?\d*|\d{2}/\d{2}/\d{2}", "", label).strip()
-        clean_pattern = re.sub(r"[^a-zA-Z\s]", "", pattern).strip().upper()
-        clean_pattern = re.sub(r"\s+", " ", clean_pattern)
-        if len(clean_pattern) > 2:
-            add_learning_rule(clean_pattern, category)
-    bulk_update_transaction_status(tx_ids, category, tags=tags, beneficiary=beneficiary)
-    if member_update:
-        for tx_id in tx_ids:
-            update_transaction_member(tx_id, member_update)
+PAGE_SIZE_OPTIONS = [20, 50, 100]
+DEFAULT_PAGE_SIZE = 50
+
+# Columns read by grouping, the summary grid and validation (the rest is never copied)
+VALIDATION_COLUMNS = [
+    "id",
+    "date",
+    "label",
+    "amount",
+    "is_manually_ungrouped",
+    "category_validated",
+    "original_category",
+    "member",
+    "card_suffix",
+]
+
+
+# Label cleanup for learned rules: card/date noise, then non-letters, then spaces
+_LABEL_NOISE_RE = re.compile(r"CARTE|CB\*?\d*|\d{2}/\d{2}/\d{2}", re.IGNORECASE)
+_NON_LETTER_RE = re.compile(r"[^a-zA-Z\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def learn_rules_from_labels(labels: pd.Series, categories: pd.Series):
+    """
+    Learn one categorization rule per distinct (pattern, category) pair.
+
+    Each label is stripped of card/date noise, non-letters and repeated spaces,
+    upper-cased, and patterns of 3+ characters are written in a single batch.
+    """
+    patterns = (
+        labels.astype(str)
+        .str.replace(_LABEL_NOISE_RE, "", regex=True)
+        .str.replace(_NON_LETTER_RE, "", regex=True)
+        .str.upper()
+        .str.replace(_WHITESPACE_RE, " ", regex=True)
+        .str.strip()
+    )
+    rules = pd.DataFrame({"pattern": patterns.to_numpy(), "category": categories.to_numpy()})
+    rules = rules[rules["pattern"].str.len() > 2].drop_duplicates()
+    add_learning_rules(list(zip(rules["pattern"], rules["category"])))
 
 
 def render_validation_tab():
@@ -90,155 +122,128 @@ def render_validation_tab():
             else:
                 toast_warning(msg, icon="⚠️")
 
-    st.divider()
+    # Filtres compte / membre, appliqués en un seul masque avant regroupement et pagination
+    col_acc, col_mem, col_size = st.columns([2, 2, 1])
+    with col_acc:
+        accounts = sorted(df["account_label"].dropna().unique().tolist())
+        selected_accounts = st.multiselect("Compte", accounts, key="val_filter_accounts")
+    with col_mem:
+        members = sorted(df["member"].dropna().unique().tolist())
+        selected_members = st.multiselect("Membre", members, key="val_filter_members")
+    with col_size:
+        page_size = st.selectbox(
+            "Groupes par page",
+            PAGE_SIZE_OPTIONS,
+            index=PAGE_SIZE_OPTIONS.index(DEFAULT_PAGE_SIZE),
+            key="val_page_size",
+        )
 
-    # Bulk Selection State
-    if "bulk_selected_groups" not in st.session_state:
-        st.session_state["bulk_selected_groups"] = set()
+    mask = np.ones(len(df), dtype=bool)
+    if selected_accounts:
+        mask &= df["account_label"].isin(selected_accounts).to_numpy()
+    if selected_members:
+        mask &= df["member"].isin(selected_members).to_numpy()
+    if not mask.all():
+        df = df[mask]
+
+    st.divider()
 
     # Components Data
     cat_emoji_map = get_categories_with_emojis()
-    available_categories = sorted(list(cat_emoji_map.keys()))
+    available_categories = sorted(cat_emoji_map)
     active_card_maps = get_member_mappings()
 
     @st.fragment
     def show_validation_list(
-        filtered_df, available_categories, cat_emoji_map, sort_key, active_card_maps, key_suffix=""
+        filtered_df, available_categories, sort_key, active_card_maps, key_suffix=""
     ):
-        local_df = get_smart_groups(filtered_df, excluded_ids=set())
+        if filtered_df.empty:
+            st.info("Aucune transaction ne correspond aux filtres.")
+            return
+
+        columns = [c for c in VALIDATION_COLUMNS if c in filtered_df.columns]
+        local_df = get_smart_groups(filtered_df[columns], excluded_ids=set())
         group_stats = calculate_group_stats(local_df)
         all_groups = sort_groups(group_stats, sort_key=sort_key, max_groups=None)
 
         # Pagination avec le composant réutilisable
         display_groups = paginated_list(
             all_groups,
-            page_size=20,  # 20 groupes par page
+            page_size=page_size,
             key=f"validation_pagination{key_suffix}",
         )
 
-        if len(all_groups) > 20:
+        if len(all_groups) > page_size:
             st.caption(f"Affichage de {len(display_groups)} groupe(s) sur {len(all_groups)} total.")
 
-        # BULK VALIDATION - Header avec checkbox "Tout sélectionner"
-        selected_in_session = st.session_state.get("bulk_selected_groups", set())
-        all_group_names = set(display_groups)
-
-        col_header, col_select_all = st.columns([6, 1])
-        with col_header:
-            if selected_in_session:
-                st.write(f"**{len(selected_in_session)}** groupe(s) sélectionné(s)")
-        with col_select_all:
-            select_all = st.checkbox("Tout", key=f"select_all{key_suffix}")
-            if select_all:
-                st.session_state["bulk_selected_groups"] = all_group_names.copy()
-            elif not select_all and selected_in_session == all_group_names:
-                # Décocher tout si c'était tout sélectionné
-                st.session_state["bulk_selected_groups"] = set()
-
-        # Barre d'action groupée (sticky en haut)
-        if selected_in_session:
-            with st.container(border=True):
-                st.write(f"🎯 **{len(selected_in_session)}** groupe(s) sélectionné(s)")
-                cols = st.columns([2, 2, 1])
-
-                with cols[0]:
-                    bulk_category = st.selectbox(
-                        "Catégorie", available_categories, key=f"bulk_cat{key_suffix}"
-                    )
-                with cols[1]:
-                    bulk_member = st.selectbox("Membre", all_members, key=f"bulk_mem{key_suffix}")
-                with cols[2]:
-                    st.write("")
-                    st.write("")
-                    if st.button(
-                        "✅ Valider tout",
-                        type="primary",
-                        use_container_width=True,
-                        key=f"bulk_val{key_suffix}",
-                    ):
-                        # Valider tous les groupes sélectionnés
-                        total_validated = 0
-                        for group_name in selected_in_session:
-                            if group_name in display_groups:
-                                g_df = local_df[local_df["clean_group"] == group_name]
-                                g_ids = g_df["id"].tolist()
-                                validate_with_memory(
-                                    g_ids, g_df.iloc[0]["label"], bulk_category, True, bulk_member
-                                )
-                                total_validated += len(g_ids)
-
-                        validation_feedback(total_validated, "opération")
-                        st.session_state["bulk_selected_groups"] = set()
-                        st.rerun()
-
-        def handle_row_validation(row_id, category, member):
-            target_group = next(
-                (
-                    g
-                    for g in display_groups
-                    if local_df[local_df["clean_group"] == g].iloc[0]["id"] == row_id
-                ),
-                None,
-            )
-            if not target_group:
-                return
-
-            g_df = local_df[local_df["clean_group"] == target_group]
-            g_ids = g_df["id"].tolist()
+        # Une seule grille éditable pour la page courante (au lieu de ~8 widgets par groupe)
+        summary = build_group_summary(local_df, display_groups)
+        unknown_member = ~summary["member"].isin(all_members)
+        summary.loc[unknown_member, "member"] = (
+            summary.loc[unknown_member, "card_suffix"].map(active_card_maps).fillna("")
+        )
 
-            validate_with_memory(g_ids, g_df.iloc[0]["label"], category, True, member)
-            validation_feedback(len(g_ids), "opération")
+        select_all = st.checkbox("Tout sélectionner", key=f"select_all{key_suffix}")
+        summary["validate"] = False
+
+        page = st.session_state.get(f"validation_pagination{key_suffix}_page", 1)
+        edited = st.data_editor(
+            summary[["validate", "date", "label", "count", "total_amount", "category", "member"]],
+            column_config={
+                "validate": st.column_config.CheckboxColumn("✅", width="small"),
+                "date": st.column_config.Column("Date"),
+                "label": st.column_config.Column("Libellé", width="large"),
+                "count": st.column_config.NumberColumn("Opérations", format="%d"),
+                "total_amount": st.column_config.NumberColumn("Montant", format="%.2f €"),
+                "category": st.column_config.SelectboxColumn(
+                    "📂 Catégorie", options=available_categories, required=True
+                ),
+                "member": st.column_config.SelectboxColumn("👤 Membre", options=all_members),
+            },
+            disabled=["date", "label", "count", "total_amount"],
+            hide_index=True,
+            num_rows="fixed",
+            use_container_width=True,
+            key=f"validation_editor{key_suffix}_{page}_{page_size}",
+        )
+        # Appliqué après l'éditeur : cocher la case ne remonte pas la grille (modifs conservées)
+        if select_all:
+            edited["validate"] = True
+
+        to_validate = edited[edited["validate"]]
+        if st.button(
+            f"✅ Valider la sélection ({len(to_validate)})",
+            type="primary",
+            disabled=to_validate.empty,
+            key=f"bulk_val{key_suffix}",
+        ):
+            group_ids = local_df[local_df["clean_group"].isin(to_validate.index)].groupby(
+                "clean_group"
+            )["id"]
+            ids_by_group = {name: ids.tolist() for name, ids in group_ids}
+
+            learn_rules_from_labels(to_validate["label"], to_validate["category"])
+
+            # Une seule transaction SQL (et un seul groupe d'annulation) pour toute la sélection
+            tx_ids, tx_categories, tx_members = [], [], []
+            for name, category, member in zip(
+                to_validate.index, to_validate["category"], to_validate["member"].fillna("")
+            ):
+                group_tx_ids = ids_by_group[name]
+                tx_ids.extend(group_tx_ids)
+                tx_categories.extend([category] * len(group_tx_ids))
+                tx_members.extend([member or None] * len(group_tx_ids))
+            bulk_validate_transactions(tx_ids, tx_categories, tx_members)
+            total_validated = len(tx_ids)
+
+            validation_feedback(total_validated, "opération")
             st.rerun()
 
-        for group_name in display_groups:
-            group_df = local_df[local_df["clean_group"] == group_name]
-            row = group_df.iloc[0]
-
-            # Checkbox pour sélection en masse
-            is_selected = group_name in st.session_state.get("bulk_selected_groups", set())
-            new_selected = st.checkbox(
-                "",
-                value=is_selected,
-                key=f"chk{key_suffix}_{group_name}",
-                label_visibility="collapsed",
-            )
-
-            if new_selected != is_selected:
-                if new_selected:
-                    st.session_state["bulk_selected_groups"].add(group_name)
-                else:
-                    st.session_state["bulk_selected_groups"].discard(group_name)
-                st.rerun(scope="fragment")
-
-            row_data = {
-                "id": row["id"],
-                "label": row["label"],
-                "date": row["date"],
-                "total_amount": group_df["amount"].sum(),
-                "count": len(group_df),
-                "category": row.get("category_validated") or row["original_category"],
-                "member": row.get("member", ""),
-            }
-
-            if not row_data["member"] or row_data["member"] not in all_members:
-                suffix = row.get("card_suffix")
-                if suffix and suffix in active_card_maps:
-                    row_data["member"] = active_card_maps[suffix]
-
-            render_validation_row(
-                row_data=row_data,
-                all_members=all_members,
-                all_categories=available_categories,
-                cat_emoji_map=cat_emoji_map,
-                on_validate=handle_row_validation,
-                key_prefix=key_suffix,
-            )
-
     tab_all, tab_unknown = st.tabs(["📋 Toutes", "🔍 Inconnues"])
 
     with tab_all:
         show_validation_list(
-            df, available_categories, cat_emoji_map, sort_key, active_card_maps, key_suffix="_all"
+            df, available_categories, sort_key, active_card_maps, key_suffix="_all"
         )
 
     with tab_unknown:
@@ -246,7 +251,6 @@ def render_validation_tab():
         show_validation_list(
             df[unknown_mask],
             available_categories,
-            cat_emoji_map,
             sort_key,
             active_card_maps,
             key_suffix="_unk",
@@ -16,6 +16,17 @@ class SortStrategy:
     AMOUNT_ASC = "amount_asc"
 
 
+# Groups (is_single=0) always come before single transactions, then the
+# strategy's own column: sort key -> (columns, ascending)
+SORT_COLUMNS = {
+    SortStrategy.COUNT: (["is_single", "count"], [True, False]),
+    SortStrategy.DATE_RECENT: (["is_single", "max_date"], [True, False]),
+    SortStrategy.DATE_OLD: (["is_single", "max_date"], [True, True]),
+    SortStrategy.AMOUNT_DESC: (["is_single", "max_amount"], [True, False]),
+    SortStrategy.AMOUNT_ASC: (["is_single", "max_amount"], [True, True]),
+}
+
+
 def sort_groups(
     group_stats: pd.DataFrame, sort_key: str = SortStrategy.COUNT, max_groups: int = 40
 ) -> list[str]:
@@ -38,33 +49,14 @@ def sort_groups(
         >>> top_groups = sort_groups(stats, SortStrategy.COUNT, max_groups=10)
         >>> # Returns top 10 groups sorted by count (largest first)
     """
-    if sort_key == SortStrategy.COUNT:
-        # Sort by count descending (largest groups first)
-        sorted_stats = group_stats.sort_values(by=["is_single", "count"], ascending=[True, False])
-    elif sort_key == SortStrategy.DATE_RECENT:
-        # Sort by date descending (most recent first)
-        sorted_stats = group_stats.sort_values(
-            by=["is_single", "max_date"], ascending=[True, False]
-        )
-    elif sort_key == SortStrategy.DATE_OLD:
-        # Sort by date ascending (oldest first)
-        sorted_stats = group_stats.sort_values(by=["is_single", "max_date"], ascending=[True, True])
-    elif sort_key == SortStrategy.AMOUNT_DESC:
-        # Sort by amount descending (largest first)
-        sorted_stats = group_stats.sort_values(
-            by=["is_single", "max_amount"], ascending=[True, False]
-        )
-    elif sort_key == SortStrategy.AMOUNT_ASC:
-        # Sort by amount ascending (smallest first)
-        sorted_stats = group_stats.sort_values(
-            by=["is_single", "max_amount"], ascending=[True, True]
-        )
-    else:
-        # Default to count sorting
-        sorted_stats = group_stats.sort_values(by=["is_single", "count"], ascending=[True, False])
+    # Unknown keys fall back to count sorting
+    by, ascending = SORT_COLUMNS.get(sort_key, SORT_COLUMNS[SortStrategy.COUNT])
+    # Ties are broken on the group name, so the order does not depend on how
+    # calculate_group_stats ordered its rows
+    sorted_stats = group_stats.sort_values(by=[*by, "clean_group"], ascending=[*ascending, True])
 
     # Limit to max_groups
-    return sorted_stats["clean_group"].tolist()[:max_groups]
+    return sorted_stats["clean_group"].iloc[:max_groups].tolist()
 
 
 def get_sort_options() -> dict[str, str]:
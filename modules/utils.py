@@ -4,7 +4,15 @@ Centralizes common operations to avoid code duplication.
 """
 
 import html
+import os
 import re
+import string
+from functools import lru_cache
+
+import pandas as pd
+
+# Extensions accepted by validate_csv_file (compared against the lowercased suffix)
+_ALLOWED_EXTS = frozenset({".csv", ".xlsx", ".xls"})
 
 
 def validate_regex_pattern(pattern: str) -> tuple[bool, str]:
@@ -67,32 +75,62 @@ def validate_regex_pattern(pattern: str) -> tuple[bool, str]:
         return False, f"Erreur inattendue: {e}"
 
 
+# clean_label steps, in order: dates, bank prefixes/card refs, long numbers,
+# leading/trailing punctuation, repeated whitespace
+_LABEL_DATE_RE = re.compile(r"\d{2}/\d{2}(/\d{2,4})?")
+_LABEL_PREFIX_RE = re.compile(r"\b(CARTE|CB|PRLV|SEPA|VIR)\b\*?\d*", re.IGNORECASE)
+_LABEL_LONG_NUMBER_RE = re.compile(r"\b\d{4,}\b")
+_LABEL_EDGE_NOISE_RE = re.compile(r"^[^a-zA-Z0-9]+|[^a-zA-Z0-9]+$")
+_LABEL_SPACES_RE = re.compile(r"\s+")
+
+
 def clean_label(label):
     """
     Remove common bank noise to help AI focus on merchant name.
     Ex: 'VIR Virement de Aurelien...' -> 'Virement Aurelien'
     """
     # Remove dates (dd/mm/yy or dd/mm)
-    label = re.sub(r"\d{2}/\d{2}(/\d{2,4})?", "", label)
+    label = _LABEL_DATE_RE.sub("", label)
 
     # Remove technical bank prefixes but KEEP "Virement", "Cotisation" if they are part of the name
     # We remove "CARTE", "CB", "PRLV" (Prélèvement can be noisy but let's see), "
     # "SEPA", "VIR" (often redundant with Virement)
-    label = re.sub(r"(?i)\b(CARTE|CB|PRLV|SEPA|VIR)\b\*?\d*", "", label)
+    label = _LABEL_PREFIX_RE.sub("", label)
 
     # Remove numbers with * that are often card references
-    label = re.sub(r"\b\d{4,}\b", "", label)  # Long numbers
+    label = _LABEL_LONG_NUMBER_RE.sub("", label)  # Long numbers
 
     # Remove leading/trailing non-alphanumeric
-    label = re.sub(r"^[^a-zA-Z0-9]+|[^a-zA-Z0-9]+$", "", label)
+    label = _LABEL_EDGE_NOISE_RE.sub("", label)
 
     # Remove multiple spaces
-    label = re.sub(r"\s+", " ", label)
+    label = _LABEL_SPACES_RE.sub(" ", label)
 
     # Title Case
     return label.strip().title()
 
 
+def clean_label_series(labels: pd.Series) -> pd.Series:
+    """
+    Vectorized clean_label over a Series of labels (same steps, same result).
+
+    Recurring merchants repeat the same label, so each distinct label is
+    cleaned once and the result is mapped back onto every row.
+    """
+    codes, uniques = pd.factorize(labels.astype(str))
+    cleaned = (
+        pd.Series(uniques, dtype=object)
+        .str.replace(_LABEL_DATE_RE, "", regex=True)
+        .str.replace(_LABEL_PREFIX_RE, "", regex=True)
+        .str.replace(_LABEL_LONG_NUMBER_RE, "", regex=True)
+        .str.replace(_LABEL_EDGE_NOISE_RE, "", regex=True)
+        .str.replace(_LABEL_SPACES_RE, " ", regex=True)
+        .str.strip()
+        .str.title()
+    )
+    return pd.Series(cleaned.to_numpy()[codes], index=labels.index, name=labels.name)
+
+
 def extract_card_member(label, card_map=None):
     """
     Extract member name from card number in label.
@@ -116,10 +154,12 @@ def validate_csv_file(uploaded_file, max_size_mb=10):
     if uploaded_file is None:
         return False, "Aucun fichier sélectionné"
 
-    # Check file size
-    uploaded_file.seek(0, 2)  # Seek to end
-    size_bytes = uploaded_file.tell()
-    uploaded_file.seek(0)  # Reset to beginning
+    # Check file size (Streamlit's UploadedFile exposes .size directly)
+    size_bytes = getattr(uploaded_file, "size", None)
+    if size_bytes is None:
+        uploaded_file.seek(0, 2)  # Seek to end
+        size_bytes = uploaded_file.tell()
+        uploaded_file.seek(0)  # Reset to beginning
 
     max_size_bytes = max_size_mb * 1024 * 1024
     if size_bytes > max_size_bytes:
@@ -130,7 +170,8 @@ def validate_csv_file(uploaded_file, max_size_mb=10):
 
     # Check extension
     filename = getattr(uploaded_file, "name", "")
-    if not filename.lower().endswith((".csv", ".xlsx", ".xls")):
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in _ALLOWED_EXTS:
         return False, f"Format non supporté: {filename}. Utilisez CSV ou Excel."
 
     return True, ""
@@ -138,9 +179,8 @@ def validate_csv_file(uploaded_file, max_size_mb=10):
 
 def format_currency(amount, symbol="€"):
     """Format amount as currency string."""
-    if amount >= 0:
-        return f"+{amount:,.2f} {symbol}"
-    return f"{amount:,.2f} {symbol}"
+    # "+" signs non-negative amounts; "z" prints a negative zero (-0.0, -0.001) as +0.00
+    return f"{amount:+z,.2f} {symbol}"
 
 
 def escape_html(text: str) -> str:
@@ -177,6 +217,39 @@ def safe_html_template(template: str, **kwargs) -> str:
     Returns:
         Safe HTML string with escaped values
     """
-    # Escape all kwargs
-    safe_kwargs = {key: escape_html(value) for key, value in kwargs.items()}
-    return template.format(**safe_kwargs)
+    # Escape all kwargs (plain strings skip escape_html's None check and str() call)
+    safe_kwargs = {
+        key: html.escape(value, quote=True) if isinstance(value, str) else escape_html(value)
+        for key, value in kwargs.items()
+    }
+
+    segments = _parsed_template(template)
+    if segments is None:
+        # Attribute/index lookups, conversions or nested specs: let str.format handle it
+        return template.format(**safe_kwargs)
+
+    parts = []
+    for literal, field_name, format_spec in segments:
+        parts.append(literal)
+        if field_name is not None:
+            value = safe_kwargs[field_name]
+            parts.append(format(value, format_spec) if format_spec else value)
+    return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _parsed_template(template: str) -> tuple | None:
+    """
+    Parse a template's {placeholders} once and cache the result.
+
+    Returns a tuple of (literal_text, field_name, format_spec) segments, or None
+    when the template uses features that need the full str.format machinery.
+    """
+    segments = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (
+            not field_name.isidentifier() or conversion or "{" in (format_spec or "")
+        ):
+            return None
+        segments.append((literal, field_name, format_spec))
+    return tuple(segments)
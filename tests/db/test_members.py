@@ -5,6 +5,7 @@ Tests for members.py module.
 from modules.db.members import (
     add_member,
     add_member_mapping,
+    bulk_update_transaction_members,
     delete_member,
     delete_member_mapping,
     get_member_mappings,
@@ -163,6 +164,32 @@ class TestRenameMember:
         assert cursor.fetchone()[0] == 0
 
 
+class TestBulkUpdateTransactionMembers:
+    """Tests for assigning a member to several transactions at once."""
+
+    def test_bulk_update_transaction_members(self, temp_db, db_connection):
+        """Test that only the given transactions are updated."""
+        cursor = db_connection.cursor()
+        for label in ("TX 1", "TX 2", "TX 3"):
+            cursor.execute(
+                "INSERT INTO transactions (date, label, amount, member) "
+                "VALUES ('2024-01-15', ?, -10.0, 'Inconnu')",
+                (label,),
+            )
+        db_connection.commit()
+        cursor.execute("SELECT id FROM transactions ORDER BY id")
+        ids = [row[0] for row in cursor.fetchall()]
+
+        bulk_update_transaction_members(ids[:2], "Alice")
+
+        cursor.execute("SELECT member FROM transactions ORDER BY id")
+        assert [row[0] for row in cursor.fetchall()] == ["Alice", "Alice", "Inconnu"]
+
+    def test_bulk_update_transaction_members_empty(self, temp_db):
+        """Test that an empty id list is a no-op."""
+        bulk_update_transaction_members([], "Alice")
+
+
 class TestMemberMappings:
     """Tests for card suffix to member mappings."""
 
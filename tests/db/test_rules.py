@@ -6,6 +6,7 @@ import pandas as pd
 
 from modules.db.rules import (
     add_learning_rule,
+    add_learning_rules,
     delete_learning_rule,
     get_compiled_learning_rules,
     get_learning_rules,
@@ -41,6 +42,15 @@ class TestAddRule:
         result = add_learning_rule("AMAZON", "Achats", priority=5)
         assert result is True
 
+    def test_add_learning_rules_bulk(self, temp_db):
+        """Test adding several rules at once, skipping invalid patterns."""
+        written = add_learning_rules([("SNCF", "Transport"), ("FNAC", "Achats"), ("(", "Autre")])
+        assert written == 2
+
+        df = get_learning_rules()
+        assert {"SNCF", "FNAC"} <= set(df["pattern"])
+        assert "(" not in set(df["pattern"])
+
 
 class TestCompiledRules:
     """Tests for compiled rules."""
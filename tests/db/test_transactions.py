@@ -6,13 +6,16 @@ import pandas as pd
 
 from modules.db.transactions import (
     bulk_update_transaction_status,
+    bulk_validate_transactions,
     delete_transaction_by_id,
     delete_transactions_by_period,
     get_all_transactions,
+    get_existing_hashes,
     get_pending_transactions,
     save_transactions,
     update_transaction_category,
 )
+from modules.ingestion import generate_tx_hash
 
 
 class TestGetTransactions:
@@ -49,6 +52,24 @@ class TestGetTransactions:
         assert not df.empty
 
 
+class TestExistingHashes:
+    """Tests for targeted duplicate lookup."""
+
+    def test_get_existing_hashes(self, temp_db, sample_transactions):
+        """Only hashes present in the database are returned."""
+        df_sample = pd.DataFrame(sample_transactions)
+        save_transactions(df_sample)
+
+        stored = get_all_transactions()["tx_hash"].tolist()
+        result = get_existing_hashes([stored[0], "not-a-real-hash"])
+
+        assert result == {stored[0]}
+
+    def test_get_existing_hashes_empty_input(self, temp_db):
+        """Empty candidate list does not hit the database."""
+        assert get_existing_hashes([]) == set()
+
+
 class TestSaveTransaction:
     """Tests for inserting/saving transactions."""
 
@@ -73,6 +94,20 @@ class TestSaveTransaction:
         assert df_all.iloc[0]["label"] == "TEST TRANSACTION"
         assert df_all.iloc[0]["amount"] == -100.00
 
+    def test_reimport_keeps_new_identical_transaction(self, temp_db):
+        """A second identical same-day payment is imported next to the stored one."""
+        coffee = {"date": "2025-01-05", "label": "CAFE", "amount": -3.00}
+        save_transactions(generate_tx_hash(pd.DataFrame([coffee])))
+
+        df_file = generate_tx_hash(pd.DataFrame([coffee, coffee]))
+        # Only the first occurrence is a known duplicate...
+        assert len(get_existing_hashes(df_file["tx_hash"].tolist())) == 1
+
+        # ...and the whole file goes to save_transactions, which counts signatures
+        new, skipped = save_transactions(df_file)
+        assert (new, skipped) == (1, 1)
+        assert len(get_all_transactions()) == 2
+
 
 class TestUpdateTransaction:
     """Tests for updating transactions."""
@@ -116,6 +151,24 @@ class TestUpdateTransaction:
         assert df_all.iloc[0]["category_validated"] == "Transport"
         assert df_all.iloc[1]["category_validated"] == "Transport"
 
+    def test_bulk_validate_transactions(self, temp_db, sample_transactions):
+        """Test validating transactions with per-transaction categories and members."""
+        df_sample = pd.DataFrame(sample_transactions)
+        save_transactions(df_sample)
+
+        df_all = get_all_transactions()
+        tx_ids = [int(x) for x in df_all["id"].tolist()[:2]]
+        previous_member = df_all.iloc[1]["member"]
+
+        bulk_validate_transactions(tx_ids, ["Transport", "Loisirs"], ["Alice", None])
+
+        df_all = get_all_transactions().set_index("id")
+        assert df_all.loc[tx_ids[0], "category_validated"] == "Transport"
+        assert df_all.loc[tx_ids[0], "member"] == "Alice"
+        assert df_all.loc[tx_ids[1], "category_validated"] == "Loisirs"
+        assert df_all.loc[tx_ids[1], "member"] == previous_member
+        assert (df_all.loc[tx_ids, "status"] == "validated").all()
+
 
 class TestDeleteTransaction:
     """Tests for deleting transactions."""
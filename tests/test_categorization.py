@@ -215,6 +215,37 @@ class TestCategorizationBatch:
         assert len(results) == 0
 
 
+class TestCategorizationColumnBatch:
+    """Tests la catégorisation vectorisée sur colonnes."""
+
+    def test_exact_then_priority_rules(self):
+        """Règle exacte d'abord, puis règles partielles par priorité."""
+        from modules.categorization import categorize_columns
+
+        rules = [
+            {"pattern": "AMAZON", "category": "Achats", "priority": 10},
+            {"pattern": "PRIME", "category": "Abonnements", "priority": 50},
+            {"pattern": "netflix", "category": "Loisirs", "priority": 1},
+        ]
+        categories, sources, confidences = categorize_columns(
+            ["Netflix", "AMAZON PRIME", "amazon fr", "BOULANGERIE"],
+            [-15.99, -49.0, -20.0, -3.5],
+            rules=rules,
+        )
+
+        assert list(categories) == ["Loisirs", "Abonnements", "Achats", "Inconnu"]
+        assert list(sources) == ["rule", "rule", "rule", "none"]
+        assert list(confidences) == [1.0, 0.9, 0.9, 0.0]
+
+    def test_empty_input(self):
+        """Gère une entrée vide."""
+        from modules.categorization import categorize_columns
+
+        categories, sources, confidences = categorize_columns([], [], rules=[])
+
+        assert len(categories) == len(sources) == len(confidences) == 0
+
+
 class TestCategorizationCache:
     """Tests le caching des résultats de catégorisation."""
 
@@ -5,6 +5,7 @@ Tests for UI validation grouping logic.
 import pandas as pd
 
 from modules.ui.validation.grouping import (
+    build_group_summary,
     calculate_group_stats,
     get_group_transactions,
     get_smart_groups,
@@ -173,3 +174,31 @@ class TestGetGroupTransactions:
         result = get_group_transactions(df, "GROUP_NONEXISTENT")
 
         assert len(result) == 0
+
+
+class TestBuildGroupSummary:
+    """Tests for per-group summary rows."""
+
+    def test_summary_follows_requested_order(self):
+        """Test that groups are summarized in the given order with totals."""
+        df = pd.DataFrame(
+            {
+                "id": [1, 2, 3],
+                "date": ["2024-01-01", "2024-01-02", "2024-01-03"],
+                "label": ["CARREFOUR CB*6759", "CARREFOUR CB*6759", "AUCHAN CB*1234"],
+                "amount": [-50.0, -20.0, -30.0],
+                "category_validated": [None, None, "Alimentation"],
+                "original_category": ["Courses", "Courses", "Inconnu"],
+                "is_manually_ungrouped": [0, 0, 0],
+            }
+        )
+        grouped = get_smart_groups(df)
+        order = [grouped.iloc[2]["clean_group"], grouped.iloc[0]["clean_group"]]
+
+        summary = build_group_summary(grouped, order)
+
+        assert summary.index.tolist() == order
+        assert summary["count"].tolist() == [1, 2]
+        assert summary["total_amount"].tolist() == [-30.0, -70.0]
+        assert summary["category"].tolist() == ["Alimentation", "Courses"]
+        assert summary["id"].tolist() == [3, 1]
@@ -0,0 +1,45 @@
+"""
+Tests for UI validation sorting logic.
+"""
+
+import pandas as pd
+
+from modules.ui.validation.grouping import calculate_group_stats, get_smart_groups
+from modules.ui.validation.sorting import SortStrategy, get_sort_options, sort_groups
+
+
+class TestSortGroups:
+    """Tests for group ordering."""
+
+    def test_groups_before_single_transactions(self):
+        """Test that multi-transaction groups come first, then the strategy column."""
+        stats = pd.DataFrame(
+            {
+                "clean_group": ["A", "B", "C"],
+                "count": [1, 2, 3],
+                "max_date": ["2025-01-01", "2025-01-02", "2025-01-03"],
+                "max_amount": [10.0, 20.0, 30.0],
+                "is_single": [1, 0, 0],
+            }
+        )
+
+        assert sort_groups(stats, SortStrategy.COUNT) == ["C", "B", "A"]
+        assert sort_groups(stats, SortStrategy.AMOUNT_ASC) == ["B", "C", "A"]
+
+    def test_ties_are_ordered_by_group_name(self):
+        """Test that equal sort values keep the alphabetical group order."""
+        df = pd.DataFrame(
+            {
+                "id": [1, 2, 3, 4, 5, 6],
+                "label": ["ZARA", "ZARA", "AUCHAN", "AUCHAN", "MONOP", "MONOP"],
+                "amount": [-10.0, -10.0, -10.0, -10.0, -10.0, -10.0],
+                "date": ["2025-01-05"] * 6,
+                "is_manually_ungrouped": [0] * 6,
+            }
+        )
+
+        stats = calculate_group_stats(get_smart_groups(df))
+
+        for sort_key in get_sort_options().values():
+            result = sort_groups(stats, sort_key)
+            assert result == sorted(result)
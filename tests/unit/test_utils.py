@@ -0,0 +1,87 @@
+"""
+Test Unit: Utils
+================
+"""
+
+import html
+import io
+
+import pandas as pd
+
+from modules.utils import (
+    clean_label,
+    clean_label_series,
+    format_currency,
+    safe_html_template,
+    validate_csv_file,
+)
+
+
+class TestValidateCsvFile:
+    """Tests de validation des fichiers importés"""
+
+    def test_accepts_uppercase_extension(self):
+        """Test: Extension insensible à la casse"""
+        f = io.BytesIO(b"date;label;amount")
+        f.name = "RELEVE.CSV"
+        assert validate_csv_file(f) == (True, "")
+
+    def test_rejects_unknown_extension(self):
+        """Test: Extension non supportée"""
+        f = io.BytesIO(b"data")
+        f.name = "releve.txt"
+        is_valid, error = validate_csv_file(f)
+        assert is_valid is False
+        assert "releve.txt" in error
+
+
+class TestCleanLabel:
+    """Tests du nettoyage de libellés"""
+
+    def test_clean_label_series_matches_scalar(self):
+        labels = [
+            "CARTE 12/03/24 CARREFOUR CB*6759",
+            "PRLV SEPA FREE MOBILE 123456789",
+            "VIR Virement de Aurelien",
+            "  --amazon mktp--  ",
+        ]
+        result = clean_label_series(pd.Series(labels))
+        assert result.tolist() == [clean_label(label) for label in labels]
+
+
+class TestFormatCurrency:
+    """Tests de formatage monétaire"""
+
+    def test_format_currency_sign(self):
+        """Test: Signe explicite pour les montants positifs"""
+        assert format_currency(1234.5) == "+1,234.50 €"
+        assert format_currency(-12) == "-12.00 €"
+
+    def test_format_currency_negative_zero(self):
+        """Test: Un zéro négatif s'affiche comme zéro"""
+        assert format_currency(-0.0) == "+0.00 €"
+        assert format_currency(-0.001) == "+0.00 €"
+
+
+class TestSafeHtmlTemplate:
+    """Tests d'interpolation HTML sécurisée"""
+
+    def test_escapes_values(self):
+        """Test: Les valeurs sont échappées"""
+        result = safe_html_template("<p>{title}</p>", title="<script>")
+        assert result == "<p>&lt;script&gt;</p>"
+
+    def test_matches_str_format(self):
+        """Test: Même rendu que str.format (accolades doublées, format spec)"""
+        template = "<td>{{ {label} }}</td><td>{amount:>8}</td>"
+        result = safe_html_template(template, label="A&B", amount="12")
+        assert result == template.format(label="A&amp;B", amount="12")
+
+    def test_non_string_values(self):
+        """Test: None et nombres passent par escape_html"""
+        assert safe_html_template("{a}|{b}", a=None, b=3) == "|3"
+
+    def test_string_escape_matches_html_escape(self):
+        """Test: Le chemin rapide équivaut à html.escape"""
+        value = '<a href="x">Tom & Jerry\'s</a>'
+        assert safe_html_template("{v}", v=value) == html.escape(value, quote=True)